@@ -1,6 +1,5 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -32,17 +31,21 @@ if "sslmode=" in DATABASE_URL:
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
+    pool_size=20,
+    max_overflow=10,
     pool_pre_ping=True,
     pool_recycle=300
 )
 
 # Create session factory
-AsyncSessionLocal = sessionmaker(
-    engine, 
-    class_=AsyncSession, 
+AsyncSessionFactory = async_sessionmaker(
+    engine,
     expire_on_commit=False
 )
 
+# Backwards-compatible alias used across the codebase
+AsyncSessionLocal = AsyncSessionFactory
+
 async def get_session() -> AsyncSession:
     """Get database session"""
     async with AsyncSessionLocal() as session:
@@ -51,10 +54,17 @@ async def get_session() -> AsyncSession:
         finally:
             await session.close()
 
+def _create_missing_indexes(sync_conn):
+    """Create indexes added after the tables already existed"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
 async def init_database():
     """Initialize database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 async def close_database():
     """Close database connections"""
@@ -539,6 +539,9 @@ class BetBogSystem:
                 strategies_result = await session.execute(select(StrategyConfig))
                 strategies = strategies_result.scalars().all()
                 
+                eligible_strategies = []
+                signal_batches = []
+                
                 for strategy in strategies:
                     if strategy.total_signals < self.config.MIN_SAMPLES_FOR_LEARNING:
                         self.logger.warning(f"Not enough data for {strategy.strategy_name}: {strategy.total_signals}")
@@ -565,13 +568,20 @@ class BetBogSystem:
                         }
                         signal_data.append(signal_dict)
                     
-                    # Optimize strategy
-                    optimal_thresholds = await self.ml_optimizer.optimize_strategy_thresholds(
+                    eligible_strategies.append(strategy)
+                    signal_batches.append(signal_data)
+                
+                # Optimize all strategies concurrently
+                optimization_results = await asyncio.gather(*[
+                    self.ml_optimizer.optimize_strategy_thresholds(
                         strategy.strategy_name,
                         signal_data,
                         self.config.MIN_SAMPLES_FOR_LEARNING
                     )
-                    
+                    for strategy, signal_data in zip(eligible_strategies, signal_batches)
+                ])
+                
+                for strategy, optimal_thresholds in zip(eligible_strategies, optimization_results):
                     if optimal_thresholds:
                         # Update strategy configuration
                         current_config = json.loads(strategy.config) if isinstance(strategy.config, str) else strategy.config
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -92,6 +92,26 @@ class Signal(Base):
     # Relationships
     match = relationship("Match", back_populates="signals")
 
+# Menu views list the latest pending signals and recently updated matches
+Index(
+    "ix_signal_pending_created",
+    Signal.created_at.desc(),
+    postgresql_where=(Signal.result == "pending")
+)
+Index("ix_match_updated", Match.updated_at.desc())
+
+# Signal lists and counts per result (won/lost views, completed P&L series);
+# the leading result column also serves the GROUP BY result aggregates
+Index("ix_signal_result_created", Signal.result, Signal.created_at.desc())
+
+# The strategy optimizer reads resolved signals per strategy over a date window
+Index(
+    "ix_signal_strategy_created",
+    Signal.strategy_name,
+    Signal.created_at.desc(),
+    postgresql_where=Signal.result.isnot(None)
+)
+
 class StrategyConfig(Base):
     __tablename__ = "strategy_configs"
     
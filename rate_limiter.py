@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for asyncio code (aiolimiter-style)
+
+    Allows bursts of up to `max_rate` operations and refills at
+    `max_rate` tokens per `time_period` seconds.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = float(max_rate)
+        self.time_period = float(time_period)
+        self._refill_rate = self.max_rate / self.time_period
+        self._tokens = self.max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add tokens accumulated since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self._refill_rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and consume them"""
+        if tokens > self.max_rate:
+            raise ValueError(f"Cannot acquire {tokens} tokens, capacity is {self.max_rate}")
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= tokens
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
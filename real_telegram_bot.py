@@ -6,26 +6,208 @@
 
 import asyncio
 import os
+import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
+from telegram.ext import (
+    Application, ApplicationHandlerStop, CallbackQueryHandler, CommandHandler, ContextTypes, TypeHandler
+)
 
 from config import Config
 from logger import BetBogLogger
 from database import AsyncSessionLocal
 from models import Signal, Match, StrategyConfig
 from sqlalchemy import select, desc, func
+from sqlalchemy.orm import load_only, raiseload
+
+# Время жизни кэша агрегатов меню (секунды): повторные нажатия кнопок не нагружают БД
+_STATS_CACHE_TTL = 5.0
+
+# Статические тексты меню собираются один раз при импорте
+_WELCOME_TEXT = """
+╭─────────────────────────────────────────╮
+│         🎯 Добро пожаловать в BetBog     │
+╰─────────────────────────────────────────╯
+
+🤖 Интеллектуальная система мониторинга ставок
+
+🟢 Система активна и анализирует live матчи
+📊 7 стратегий работают в реальном времени
+🎯 Поиск сигналов с высокой точностью
+
+Выберите нужный раздел:
+        """
+
+_HELP_TEXT = """
+╭─────────────────────────────────────────╮
+│           ❓ Помощь BetBog               │
+╰─────────────────────────────────────────╯
+
+🤖 BetBog - система мониторинга ставок
+
+📱 Основные команды:
+• /start - Запуск и главное меню
+• /menu - Главное меню
+• /signals - Активные сигналы
+• /stats - Статистика и P&L
+• /matches - Live матчи
+• /help - Эта справка
+
+🎯 Функции системы:
+• Анализ live футбольных матчей
+• 7 адаптивных стратегий ставок
+• Расчет продвинутых метрик (dxG, momentum, gradient)
+• Отслеживание P&L и статистики
+• Уведомления о новых сигналах
+
+📊 Метрики:
+• dxG - derived Expected Goals
+• Gradient - тренд производительности  
+• Momentum - импульс команд
+• Wave - амплитуда интенсивности
+• Tiredness - фактор усталости
+
+Система работает 24/7 с реальными данными!
+        """
+
+_SIGNALS_HEADER_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│           🎯 Сигналы BetBog              │
+╰─────────────────────────────────────────╯
+
+📊 Общая статистика:
+• Всего сигналов: {total}
+• Активных: {active}
+• Выиграно: {won} 
+• Проиграно: {lost}
+• Winrate: {winrate:.1f}%
+
+🔴 Активные сигналы:
+            """
+
+_STATS_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│          📊 Статистика BetBog            │
+╰─────────────────────────────────────────╯
+
+📈 Общие показатели:
+• Всего сигналов: {total_signals}
+• Завершено: {completed_signals}
+• Выиграно: {won_signals}
+• Проиграно: {lost_signals}
+• Winrate: {winrate:.1f}%
+
+💰 Финансовые показатели:
+• Общий P&L: {total_pnl:+.2f}
+• ROI: {roi:+.1f}%
+• Средний результат: {avg_result:.2f}
+
+🎯 Производительность:
+• Активность: {activity:.1f} сигналов/день
+• Эффективность: {efficiency}
+            """
+
+_MATCHES_HEADER = """
+╭─────────────────────────────────────────╮
+│           ⚽ Live Матчи                   │
+╰─────────────────────────────────────────╯
+            """
+
+_RESULT_EMOJIS = {"won": "✅", "lost": "❌"}
+_PNL_EMOJIS = ("❤️", "💛", "💚")  # индекс: знак P&L + 1
+
+
+def _format_matches(matches_list) -> str:
+    """Текст раздела live матчей по строкам последних матчей"""
+    parts = [_MATCHES_HEADER]
+
+    if not matches_list:
+        parts.append("\n❌ Нет активных матчей")
+    else:
+        parts.append(f"\n📊 Найдено {len(matches_list)} матчей:\n")
+        
+        for i, match in enumerate(matches_list, 1):
+            status = "🔴 LIVE" if match.status == "live" else "⚪ Завершен"
+            parts.append(f"""
+{i}. {status} {match.home_team} vs {match.away_team}
+   📊 Счет: {match.home_score}:{match.away_score} | {match.minute}'
+   🏆 Лига: {match.league}
+                    """)
+
+    return "".join(parts)
 
 
 class RealTelegramBot:
     """Реальный Telegram бот для BetBog"""
     
+    # Клавиатуры неизменяемы - собираем их один раз, а не на каждое нажатие
+    _KB_MAIN = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🎯 Сигналы", callback_data="signals"),
+            InlineKeyboardButton("📊 Статистика", callback_data="stats")
+        ],
+        [
+            InlineKeyboardButton("⚽ Live Матчи", callback_data="matches"),
+            InlineKeyboardButton("🔧 Стратегии", callback_data="strategies")
+        ],
+        [
+            InlineKeyboardButton("📈 P&L Отчет", callback_data="pnl"),
+            InlineKeyboardButton("❓ Помощь", callback_data="help")
+        ],
+        [InlineKeyboardButton("🔄 Обновить", callback_data="refresh_main")]
+    ])
+    _KB_SIGNALS = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔄 Обновить", callback_data="refresh_signals"),
+            InlineKeyboardButton("📋 Меню", callback_data="main_menu")
+        ]
+    ])
+    _KB_STATS = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔄 Обновить", callback_data="refresh_stats"),
+            InlineKeyboardButton("📋 Меню", callback_data="main_menu")
+        ]
+    ])
+    _KB_MATCHES = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔄 Обновить", callback_data="refresh_matches"),
+            InlineKeyboardButton("📋 Меню", callback_data="main_menu")
+        ]
+    ])
+    _KB_HELP = InlineKeyboardMarkup([
+        [InlineKeyboardButton("📋 Главное меню", callback_data="main_menu")]
+    ])
+    _KB_NOTIFICATION = InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("📊 Статистика", callback_data="stats"),
+            InlineKeyboardButton("📋 Меню", callback_data="main_menu")
+        ]
+    ])
+    
     def __init__(self, config: Config):
         self.config = config
         self.logger = BetBogLogger("TELEGRAM_BOT", config.LOG_FILE)
         self.application = None
-        self.authorized_users = {123456789}  # Добавьте свой Telegram ID
+        # Список ID через запятую из AUTHORIZED_USER_IDS
+        self.authorized_users = frozenset(
+            int(user_id) for user_id in config.AUTHORIZED_USER_IDS.split(",") if user_id.strip()
+        )
+        self._stats_cache: Dict[str, tuple] = {}  # ключ -> (monotonic ts, payload)
+        self._stats_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)  # отдельная блокировка на ключ
+        # Таблица callback_data -> обработчик; кнопки меню перенаправляются на команды
+        self._cb_exact = {
+            "main_menu": self._show_main_menu,
+            "signals": self.signals_command,
+            "stats": self.stats_command,
+            "matches": self.matches_command,
+            "help": self.help_command,
+        }
+        # Динамические callback_data: обработчик получает остаток после префикса
+        self._cb_prefix = (
+            ("refresh_", self._handle_refresh),
+        )
         
     async def initialize(self):
         """Инициализация Telegram бота"""
@@ -33,6 +215,9 @@ class RealTelegramBot:
             # Создаем приложение с токеном бота
             self.application = Application.builder().token(self.config.BOT_TOKEN).build()
             
+            # Проверка доступа до всех остальных обработчиков (группа -1)
+            self.application.add_handler(TypeHandler(Update, self._auth_gate), group=-1)
+            
             # Добавляем обработчики команд
             self.application.add_handler(CommandHandler("start", self.start_command))
             self.application.add_handler(CommandHandler("menu", self.menu_command))
@@ -55,97 +240,127 @@ class RealTelegramBot:
         """Проверка авторизации пользователя"""
         return user_id in self.authorized_users
 
-    def _get_main_menu_keyboard(self) -> InlineKeyboardMarkup:
-        """Создание главного меню с кнопками"""
-        keyboard = [
-            [
-                InlineKeyboardButton("🎯 Сигналы", callback_data="signals"),
-                InlineKeyboardButton("📊 Статистика", callback_data="stats")
-            ],
-            [
-                InlineKeyboardButton("⚽ Live Матчи", callback_data="matches"),
-                InlineKeyboardButton("🔧 Стратегии", callback_data="strategies")
-            ],
-            [
-                InlineKeyboardButton("📈 P&L Отчет", callback_data="pnl"),
-                InlineKeyboardButton("❓ Помощь", callback_data="help")
-            ],
-            [InlineKeyboardButton("🔄 Обновить", callback_data="refresh_main")]
-        ]
-        return InlineKeyboardMarkup(keyboard)
+    async def _auth_gate(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Отклонить обновление от неавторизованного пользователя до вызова обработчиков"""
+        user = update.effective_user
+        if user and self._is_authorized(user.id):
+            return
 
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Обработка команды /start"""
-        user_id = update.effective_user.id
+        if update.callback_query:
+            await update.callback_query.answer("❌ Нет доступа к боту")
+        elif update.effective_message:
+            await update.effective_message.reply_text("❌ Нет доступа к боту")
+        raise ApplicationHandlerStop
+
+    async def _get_stats(self, key: str, loader):
+        """Вернуть данные меню из кэша или загрузить их, объединяя одновременные запросы"""
+        cached = self._stats_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+            return cached[1]
+
+        async with self._stats_locks[key]:
+            # Пока ждали блокировку, кэш мог обновить другой вызов
+            cached = self._stats_cache.get(key)
+            if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+                return cached[1]
+
+            payload = await loader()
+            self._stats_cache[key] = (time.monotonic(), payload)
+            return payload
+
+    async def _load_result_counts(self):
+        """Загрузить количество сигналов и P&L по результатам"""
+        async with AsyncSessionLocal() as session:
+            return await self._count_signals_by_result(session)
+
+    async def _load_signals(self, result_value: str):
+        """Загрузить последние сигналы с результатом result_value"""
+        async with AsyncSessionLocal() as session:
+            signals = await session.scalars(self._signals_query(result_value))
+            return list(signals)
+
+    @staticmethod
+    def _signals_query(result_value: str):
+        """Последние 5 сигналов с результатом result_value (только отображаемые поля)
         
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
+        raiseload превращает случайную ленивую загрузку связей или колонок
+        в исключение вместо скрытых дополнительных запросов.
+        """
+        return (
+            select(Signal)
+            .where(Signal.result == result_value)
+            .options(
+                load_only(
+                    Signal.strategy_name,
+                    Signal.signal_type,
+                    Signal.confidence,
+                    Signal.stake,
+                    raiseload=True
+                ),
+                raiseload("*")
+            )
+            .order_by(desc(Signal.created_at))
+            .limit(5)
+        )
 
-        welcome_text = """
-╭─────────────────────────────────────────╮
-│         🎯 Добро пожаловать в BetBog     │
-╰─────────────────────────────────────────╯
+    async def _load_recent_matches(self):
+        """Загрузить последние обновленные матчи (только отображаемые колонки)"""
+        async with AsyncSessionLocal() as session:
+            stmt = (
+                select(
+                    Match.home_team,
+                    Match.away_team,
+                    Match.home_score,
+                    Match.away_score,
+                    Match.minute,
+                    Match.league,
+                    Match.status
+                )
+                .order_by(desc(Match.updated_at))
+                .limit(5)
+            )
+            return (await session.execute(stmt)).all()
 
-🤖 Интеллектуальная система мониторинга ставок
+    async def _count_signals_by_result(self, session) -> Dict[Optional[str], tuple]:
+        """Количество сигналов и сумма P&L по каждому результату: result -> (count, pnl)"""
+        stmt = (
+            select(Signal.result, func.count(Signal.id), func.sum(Signal.profit_loss))
+            .group_by(Signal.result)
+        )
+        rows = (await session.execute(stmt)).all()
+        return {result: (count, pnl or 0) for result, count, pnl in rows}
 
-🟢 Система активна и анализирует live матчи
-📊 7 стратегий работают в реальном времени
-🎯 Поиск сигналов с высокой точностью
+    def _get_main_menu_keyboard(self) -> InlineKeyboardMarkup:
+        """Главное меню с кнопками"""
+        return self._KB_MAIN
 
-Выберите нужный раздел:
-        """
-        
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Обработка команды /start"""
         await update.message.reply_text(
-            welcome_text,
-            reply_markup=self._get_main_menu_keyboard()
+            _WELCOME_TEXT,
+            reply_markup=self._KB_MAIN
         )
 
     async def menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать главное меню"""
-        user_id = update.effective_user.id
-        
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
-
         await update.message.reply_text(
             "📋 Главное меню BetBog:",
-            reply_markup=self._get_main_menu_keyboard()
+            reply_markup=self._KB_MAIN
         )
 
     async def signals_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать сигналы"""
-        user_id = update.effective_user.id
-        
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
-
         try:
-            session = AsyncSessionLocal()
             try:
-                # Получаем статистику сигналов
-                total_signals = await session.scalar(select(func.count(Signal.id)))
-                active_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "pending")
-                )
-                won_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "won")
-                )
-                lost_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "lost")
-                )
-
-                # Получаем последние активные сигналы
-                stmt = (
-                    select(Signal)
-                    .where(Signal.result == "pending")
-                    .order_by(desc(Signal.created_at))
-                    .limit(5)
+                # Агрегаты общие с /stats; оба запроса параллельно на разных соединениях пула
+                counts, signals_list = await asyncio.gather(
+                    self._get_stats("result_counts", self._load_result_counts),
+                    self._get_stats("pending_signals", lambda: self._load_signals("pending"))
                 )
-                signals = await session.scalars(stmt)
-                signals_list = list(signals)
+                total_signals = sum(count for count, _ in counts.values())
+                active_signals = counts.get("pending", (0, 0))[0]
+                won_signals = counts.get("won", (0, 0))[0]
+                lost_signals = counts.get("lost", (0, 0))[0]
 
                 winrate = (won_signals / max(won_signals + lost_signals, 1) * 100) if (won_signals or lost_signals) else 0
             except Exception as e:
@@ -153,45 +368,31 @@ class RealTelegramBot:
                 total_signals = active_signals = won_signals = lost_signals = 0
                 signals_list = []
                 winrate = 0
-            finally:
-                await session.close()
-
-            signals_text = f"""
-╭─────────────────────────────────────────╮
-│           🎯 Сигналы BetBog              │
-╰─────────────────────────────────────────╯
-
-📊 Общая статистика:
-• Всего сигналов: {total_signals or 0}
-• Активных: {active_signals or 0}
-• Выиграно: {won_signals or 0} 
-• Проиграно: {lost_signals or 0}
-• Winrate: {winrate:.1f}%
 
-🔴 Активные сигналы:
-            """
+            parts = [_SIGNALS_HEADER_TEMPLATE.format_map({
+                'total': total_signals or 0,
+                'active': active_signals or 0,
+                'won': won_signals or 0,
+                'lost': lost_signals or 0,
+                'winrate': winrate
+            })]
 
             if not signals_list:
-                signals_text += "\n❌ Нет активных сигналов"
+                parts.append("\n❌ Нет активных сигналов")
             else:
                 for i, signal in enumerate(signals_list, 1):
                     confidence_emoji = "🔥" if signal.confidence > 0.8 else "⚡" if signal.confidence > 0.6 else "📈"
-                    signals_text += f"""
+                    parts.append(f"""
 {i}. {confidence_emoji} {signal.strategy_name}
    📊 {signal.signal_type} | {signal.confidence:.1%}
-   💰 Размер: {signal.bet_size:.2f}
-                    """
-
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Обновить", callback_data="refresh_signals"),
-                    InlineKeyboardButton("📋 Меню", callback_data="main_menu")
-                ]
-            ]
-            
+   💰 Размер: {signal.stake:.2f}
+                    """)
+
+            signals_text = "".join(parts)
+
             await update.message.reply_text(
                 signals_text,
-                reply_markup=InlineKeyboardMarkup(keyboard)
+                reply_markup=self._KB_SIGNALS
             )
             
         except Exception as e:
@@ -200,64 +401,35 @@ class RealTelegramBot:
 
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать статистику"""
-        user_id = update.effective_user.id
-        
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
-
         try:
-            async with AsyncSessionLocal() as session:
-                # Базовая статистика
-                total_signals = await session.scalar(select(func.count(Signal.id)))
-                won_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "won")
-                )
-                lost_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "lost")
-                )
-                
-                # P&L
-                total_pnl_result = await session.scalar(
-                    select(func.sum(Signal.profit_loss)).where(Signal.profit_loss.isnot(None))
-                )
-                total_pnl = total_pnl_result or 0
-                
-                completed_signals = (won_signals or 0) + (lost_signals or 0)
-                winrate = (won_signals / completed_signals * 100) if completed_signals > 0 else 0
-
-            stats_text = f"""
-╭─────────────────────────────────────────╮
-│          📊 Статистика BetBog            │
-╰─────────────────────────────────────────╯
-
-📈 Общие показатели:
-• Всего сигналов: {total_signals or 0}
-• Завершено: {completed_signals}
-• Выиграно: {won_signals or 0}
-• Проиграно: {lost_signals or 0}
-• Winrate: {winrate:.1f}%
-
-💰 Финансовые показатели:
-• Общий P&L: {total_pnl:+.2f}
-• ROI: {(total_pnl / max(completed_signals, 1) * 100):+.1f}%
-• Средний результат: {(total_pnl / max(completed_signals, 1)):.2f}
-
-🎯 Производительность:
-• Активность: {(total_signals or 0) / max(1, 7):.1f} сигналов/день
-• Эффективность: {'Высокая' if winrate > 60 else 'Средняя' if winrate > 45 else 'Требует улучшения'}
-            """
+            # Счетчики и P&L одним запросом с группировкой по результату
+            counts = await self._get_stats("result_counts", self._load_result_counts)
+            total_signals = sum(count for count, _ in counts.values())
+            won_signals = counts.get("won", (0, 0))[0]
+            lost_signals = counts.get("lost", (0, 0))[0]
             
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Обновить", callback_data="refresh_stats"),
-                    InlineKeyboardButton("📋 Меню", callback_data="main_menu")
-                ]
-            ]
+            # P&L
+            total_pnl = sum(pnl for _, pnl in counts.values())
+            
+            completed_signals = (won_signals or 0) + (lost_signals or 0)
+            winrate = (won_signals / completed_signals * 100) if completed_signals > 0 else 0
+
+            stats_text = _STATS_TEMPLATE.format_map({
+                'total_signals': total_signals or 0,
+                'completed_signals': completed_signals,
+                'won_signals': won_signals or 0,
+                'lost_signals': lost_signals or 0,
+                'winrate': winrate,
+                'total_pnl': total_pnl,
+                'roi': total_pnl / max(completed_signals, 1) * 100,
+                'avg_result': total_pnl / max(completed_signals, 1),
+                'activity': (total_signals or 0) / max(1, 7),
+                'efficiency': 'Высокая' if winrate > 60 else 'Средняя' if winrate > 45 else 'Требует улучшения'
+            })
             
             await update.message.reply_text(
                 stats_text,
-                reply_markup=InlineKeyboardMarkup(keyboard)
+                reply_markup=self._KB_STATS
             )
             
         except Exception as e:
@@ -266,48 +438,13 @@ class RealTelegramBot:
 
     async def matches_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать live матчи"""
-        user_id = update.effective_user.id
-        
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
-
         try:
-            async with AsyncSessionLocal() as session:
-                # Получаем последние матчи
-                stmt = select(Match).order_by(desc(Match.updated_at)).limit(10)
-                matches = await session.scalars(stmt)
-                matches_list = list(matches)
-
-            matches_text = """
-╭─────────────────────────────────────────╮
-│           ⚽ Live Матчи                   │
-╰─────────────────────────────────────────╯
-            """
+            matches_list = await self._get_stats("matches", self._load_recent_matches)
+            matches_text = _format_matches(matches_list)
 
-            if not matches_list:
-                matches_text += "\n❌ Нет активных матчей"
-            else:
-                matches_text += f"\n📊 Найдено {len(matches_list)} матчей:\n"
-                
-                for i, match in enumerate(matches_list[:5], 1):
-                    status = "🔴 LIVE" if match.status == "live" else "⚪ Завершен"
-                    matches_text += f"""
-{i}. {status} {match.home_team} vs {match.away_team}
-   📊 Счет: {match.home_score}:{match.away_score} | {match.minute}'
-   🏆 Лига: {match.league}
-                    """
-
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Обновить", callback_data="refresh_matches"),
-                    InlineKeyboardButton("📋 Меню", callback_data="main_menu")
-                ]
-            ]
-            
             await update.message.reply_text(
                 matches_text,
-                reply_markup=InlineKeyboardMarkup(keyboard)
+                reply_markup=self._KB_MATCHES
             )
             
         except Exception as e:
@@ -316,89 +453,40 @@ class RealTelegramBot:
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Показать помощь"""
-        user_id = update.effective_user.id
-        
-        if not self._is_authorized(user_id):
-            await update.message.reply_text("❌ Нет доступа к боту")
-            return
-
-        help_text = """
-╭─────────────────────────────────────────╮
-│           ❓ Помощь BetBog               │
-╰─────────────────────────────────────────╯
-
-🤖 BetBog - система мониторинга ставок
-
-📱 Основные команды:
-• /start - Запуск и главное меню
-• /menu - Главное меню
-• /signals - Активные сигналы
-• /stats - Статистика и P&L
-• /matches - Live матчи
-• /help - Эта справка
-
-🎯 Функции системы:
-• Анализ live футбольных матчей
-• 7 адаптивных стратегий ставок
-• Расчет продвинутых метрик (dxG, momentum, gradient)
-• Отслеживание P&L и статистики
-• Уведомления о новых сигналах
-
-📊 Метрики:
-• dxG - derived Expected Goals
-• Gradient - тренд производительности  
-• Momentum - импульс команд
-• Wave - амплитуда интенсивности
-• Tiredness - фактор усталости
-
-Система работает 24/7 с реальными данными!
-        """
-        
-        keyboard = [
-            [InlineKeyboardButton("📋 Главное меню", callback_data="main_menu")]
-        ]
-        
         await update.message.reply_text(
-            help_text,
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            _HELP_TEXT,
+            reply_markup=self._KB_HELP
         )
 
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Обработка нажатий на кнопки"""
         query = update.callback_query
-        user_id = query.from_user.id
-        
-        if not self._is_authorized(user_id):
-            await query.answer("❌ Нет доступа к боту")
+        await query.answer()
+
+        handler = self._cb_exact.get(query.data)
+        if handler:
+            await handler(update, context)
             return
 
-        await query.answer()
+        for prefix, prefix_handler in self._cb_prefix:
+            if query.data.startswith(prefix):
+                await prefix_handler(update, context, query.data[len(prefix):])
+                break
 
-        if query.data == "main_menu":
-            await query.edit_message_text(
-                "📋 Главное меню BetBog:",
-                reply_markup=self._get_main_menu_keyboard()
+    async def _show_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Показать главное меню в текущем сообщении"""
+        await update.callback_query.edit_message_text(
+            "📋 Главное меню BetBog:",
+            reply_markup=self._KB_MAIN
+        )
+
+    async def _handle_refresh(self, update: Update, context: ContextTypes.DEFAULT_TYPE, section: str):
+        """Обновить соответствующие данные для кнопок refresh_*"""
+        if section == "main":
+            await update.callback_query.edit_message_text(
+                "📋 Главное меню BetBog (обновлено):",
+                reply_markup=self._KB_MAIN
             )
-        elif query.data == "signals":
-            # Перенаправляем на команду сигналов
-            await self.signals_command(update, context)
-        elif query.data == "stats":
-            # Перенаправляем на команду статистики
-            await self.stats_command(update, context)
-        elif query.data == "matches":
-            # Перенаправляем на команду матчей
-            await self.matches_command(update, context)
-        elif query.data == "help":
-            # Перенаправляем на команду помощи
-            await self.help_command(update, context)
-        elif query.data.startswith("refresh_"):
-            # Обновляем соответствующие данные
-            section = query.data.replace("refresh_", "")
-            if section == "main":
-                await query.edit_message_text(
-                    "📋 Главное меню BetBog (обновлено):",
-                    reply_markup=self._get_main_menu_keyboard()
-                )
 
     async def send_signal_notification(self, signal_data: Dict[str, Any], match_data: Dict[str, Any]):
         """Отправить уведомление о новом сигнале"""
@@ -424,20 +512,13 @@ class RealTelegramBot:
 • Минута: {match_data.get('minute', 0)}'
             """
             
-            keyboard = [
-                [
-                    InlineKeyboardButton("📊 Статистика", callback_data="stats"),
-                    InlineKeyboardButton("📋 Меню", callback_data="main_menu")
-                ]
-            ]
-            
             # Отправляем всем авторизованным пользователям
             for user_id in self.authorized_users:
                 try:
                     await self.application.bot.send_message(
                         chat_id=user_id,
                         text=notification_text,
-                        reply_markup=InlineKeyboardMarkup(keyboard)
+                        reply_markup=self._KB_NOTIFICATION
                     )
                 except Exception as e:
                     self.logger.error(f"Ошибка отправки уведомления пользователю {user_id}: {e}")
@@ -450,8 +531,8 @@ class RealTelegramBot:
     async def send_result_notification(self, signal_data: Dict[str, Any], match_data: Dict[str, Any], result: str, profit_loss: float):
         """Отправить уведомление о результате"""
         try:
-            result_emoji = "✅" if result == "won" else "❌" if result == "lost" else "⏳"
-            pnl_emoji = "💚" if profit_loss > 0 else "❤️" if profit_loss < 0 else "💛"
+            result_emoji = _RESULT_EMOJIS.get(result, "⏳")
+            pnl_emoji = _PNL_EMOJIS[(profit_loss > 0) - (profit_loss < 0) + 1]
             
             notification_text = f"""
 ╭─────────────────────────────────────────╮
@@ -465,20 +546,13 @@ class RealTelegramBot:
 ⏰ Время: {datetime.now().strftime('%H:%M:%S')}
             """
             
-            keyboard = [
-                [
-                    InlineKeyboardButton("📊 Статистика", callback_data="stats"),
-                    InlineKeyboardButton("📋 Меню", callback_data="main_menu")
-                ]
-            ]
-            
             # Отправляем всем авторизованным пользователям
             for user_id in self.authorized_users:
                 try:
                     await self.application.bot.send_message(
                         chat_id=user_id,
                         text=notification_text,
-                        reply_markup=InlineKeyboardMarkup(keyboard)
+                        reply_markup=self._KB_NOTIFICATION
                     )
                 except Exception as e:
                     self.logger.error(f"Ошибка отправки результата пользователю {user_id}: {e}")
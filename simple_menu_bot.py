@@ -5,27 +5,247 @@
 """
 
 import asyncio
+import bisect
 import os
+import sys
+import time
+import aiohttp
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+from sqlalchemy import select, desc, func, case
+
 from config import Config
 from logger import BetBogLogger
-# Убираем зависимости от базы данных для стабильной работы бота
-# from database import get_session, AsyncSessionLocal
-# from models import Signal, Match, StrategyConfig
-# from sqlalchemy import select, desc, func
+from rate_limiter import AsyncTokenBucket
+from database import AsyncSessionFactory
+from models import Signal, Match
+
+try:
+    from numba import njit
+except ImportError:  # Numba опциональна: без неё ядро работает как обычный Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Время жизни кэша агрегатов меню (секунды)
+_STATS_CACHE_TTL = 5.0
+
+# Лимит Telegram: не более 30 сообщений в секунду на бота
+_NOTIFY_RATE_LIMIT = 30
+
+# Статические тексты меню собираются один раз при импорте
+_MAIN_MENU_TEXT = """
+╭─────────────────────────────────────────╮
+│         📋 BetBog Главное Меню           │
+╰─────────────────────────────────────────╯
+
+🟢 Система активна и мониторит матчи
+📊 7 стратегий анализируют данные
+🎯 Поиск сигналов в реальном времени
+
+📱 Доступные команды:
+
+🎯 /signals - Активные сигналы ставок
+📊 /stats - Статистика и P&L
+⚽ /matches - Live матчи  
+🔧 /strategies - Стратегии
+📈 /performance - Производительность
+⚙️ /settings - Настройки
+❓ /help - Помощь
+
+Введите команду для навигации по меню.
+        """
+
+_HELP_TEXT = """
+╭─────────────────────────────────────────╮
+│           ❓ Помощь BetBog               │
+╰─────────────────────────────────────────╯
+
+🤖 BetBog - система мониторинга ставок
+
+📱 Основные команды:
+• /start, /menu - Главное меню
+• /signals - Активные сигналы
+• /stats - Статистика и P&L
+• /matches - Live матчи
+• /strategies - Стратегии системы
+• /performance - Производительность
+• /settings - Настройки
+• /help - Эта справка
+
+🎯 Функции системы:
+• Анализ live футбольных матчей
+• 7 адаптивных стратегий ставок
+• Расчет продвинутых метрик (dxG, momentum, gradient)
+• Отслеживание P&L и статистики
+• Уведомления о новых сигналах
+
+📊 Метрики:
+• dxG - derived Expected Goals
+• Gradient - тренд производительности  
+• Momentum - импульс команд
+• Wave - амплитуда интенсивности
+• Tiredness - фактор усталости
+
+🔧 Стратегии:
+• DxG Hunter - поиск высокого xG
+• Momentum Rider - игра на импульсе
+• Wave Catcher - анализ волн
+• Late Drama - поздние голы
+• Comeback King - камбэки
+• Defensive Wall - оборонительная игра
+• Quick Strike - быстрые голы
+
+Система работает 24/7 с реальными данными от bet365 API!
+
+📱 Команда: /menu - Вернуться в главное меню
+        """
+
+# Шаблоны динамических блоков: статичный текст хранится один раз,
+# подставляются только значения
+_SIGNALS_HEADER_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│           🎯 Сигналы BetBog              │
+╰─────────────────────────────────────────╯
+
+📊 Общая статистика:
+• Всего сигналов: {total}
+• Активных: {active}
+• Выиграно: {won} 
+• Проиграно: {lost}
+• Winrate: {winrate:.1f}%
+
+🔴 Активные сигналы:
+            """
+_SIGNALS_FOOTER = "\n\n📱 Команды: /menu - Главное меню | /stats - Статистика"
+
+_STATS_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│          📊 Статистика BetBog            │
+╰─────────────────────────────────────────╯
+
+📈 Общие показатели:
+• Всего сигналов: {total_signals}
+• Завершено: {completed_signals}
+• Выиграно: {won_signals}
+• Проиграно: {lost_signals}
+• Winrate: {winrate:.1f}%
+
+💰 Финансовые показатели:
+• Общий P&L: {total_pnl:+.2f}
+• ROI: {roi:+.1f}%
+• Средний результат: {avg_result:.2f}
+• Макс. просадка: {max_drawdown:.2f}
+
+🎯 Производительность:
+• Активность: {activity:.1f} сигналов/день
+• Эффективность: {efficiency}
+
+📱 Команды: /menu - Главное меню | /signals - Сигналы
+            """
+
+_MATCHES_HEADER = """
+╭─────────────────────────────────────────╮
+│           ⚽ Live Матчи                   │
+╰─────────────────────────────────────────╯
+            """
+_MATCHES_FOOTER = "\n\n📱 Команды: /menu - Главное меню | /signals - Сигналы"
+
+_SIGNAL_NOTIFICATION_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│           🎯 НОВЫЙ СИГНАЛ СТАВКИ          │
+╰─────────────────────────────────────────╯
+
+{confidence_emoji} Стратегия: {strategy_name}
+⚽ Матч: {home_team} vs {away_team}
+🎯 Тип: {signal_type}
+📊 Уверенность: {confidence:.1%}
+💰 Размер ставки: {bet_size:.2f}
+⏰ Время: {time}
+
+📈 Ключевые метрики:
+• dxG: {dxg_home:.2f} - {dxg_away:.2f}
+• Momentum: {momentum:.2f}
+• Минута: {minute}'
+
+📋 Меню команд: /menu | Сигналы: /signals | Статистика: /stats
+            """
+
+_RESULT_NOTIFICATION_TEMPLATE = """
+╭─────────────────────────────────────────╮
+│        📈 РЕЗУЛЬТАТ СИГНАЛА              │
+╰─────────────────────────────────────────╯
+
+{result_emoji} Результат: {result}
+🎯 Стратегия: {strategy_name}
+⚽ Матч: {home_team} vs {away_team}
+{pnl_emoji} P&L: {profit_loss:+.2f}
+⏰ Время: {time}
+
+📱 Команды: /menu | /signals | /stats
+            """
+
+# Пороги уверенности (строго больше порога -> следующая корзина) и их эмодзи
+_CONF_BUCKETS = (0.6, 0.8)
+_CONF_EMOJIS = ("📈", "⚡", "🔥")
+
+_RESULT_EMOJIS = {"won": "✅", "lost": "❌"}
+_PNL_EMOJIS = ("❤️", "💛", "💚")  # индекс: знак P&L + 1
+
+
+def _confidence_emoji(confidence: float) -> str:
+    """Эмодзи уровня уверенности через поиск корзины по порогам"""
+    return _CONF_EMOJIS[bisect.bisect_left(_CONF_BUCKETS, confidence)]
+
+
+@lru_cache(maxsize=1)
+def _cached_hms(timestamp: int) -> str:
+    """Время ЧЧ:ММ:СС для секунды; повторные вызовы в ту же секунду берутся из кэша"""
+    return datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')
+
+
+def _write_console(text: str):
+    """Вывести блок текста в консоль одним вызовом write"""
+    sys.stdout.write(text + "\n")
+
+
+@njit("float64(float64[:])", cache=True)
+def _max_drawdown(pnls):
+    """Максимальная просадка накопленного P&L"""
+    total = 0.0
+    peak = 0.0
+    drawdown = 0.0
+    for i in range(pnls.size):
+        total += pnls[i]
+        if total > peak:
+            peak = total
+        if peak - total > drawdown:
+            drawdown = peak - total
+    return drawdown
 
 
 class SimpleTelegramMenuBot:
     """Упрощенный Telegram бот с базовым меню для BetBog"""
+
+    __slots__ = ("config", "logger", "running", "authorized_users", "_stats_cache", "_stats_lock", "_status_event",
+                 "_outbox", "_outbox_worker", "_rate_limiter")
     
     def __init__(self, config: Config):
         self.config = config
         self.logger = BetBogLogger("TELEGRAM_BOT", config.LOG_FILE)
         self.running = False
-        self.authorized_users = {123456789}  # Добавьте свой Telegram ID
-        self.menu_state = {}  # Состояние меню для каждого пользователя
+        self.authorized_users = frozenset({123456789})  # Добавьте свой Telegram ID
+        self._stats_cache: Dict[str, tuple] = {}  # ключ -> (monotonic ts, payload)
+        self._stats_lock = asyncio.Lock()
+        self._status_event = asyncio.Event()  # Сигнал о новых данных для проверки статуса
+        self._outbox: asyncio.Queue = asyncio.Queue()  # Очередь исходящих уведомлений
+        self._outbox_worker: Optional[asyncio.Task] = None
+        self._rate_limiter = AsyncTokenBucket(_NOTIFY_RATE_LIMIT, 1.0)
         
     async def initialize(self):
         """Инициализация бота"""
@@ -64,6 +284,10 @@ class SimpleTelegramMenuBot:
         """Остановка бота"""
         try:
             self.running = False
+            self._status_event.set()  # Будим цикл мониторинга, чтобы он завершился
+            if self._outbox_worker is not None:
+                self._outbox_worker.cancel()
+                self._outbox_worker = None
             self.logger.info("🛑 Telegram бот остановлен")
         except Exception as e:
             self.logger.error(f"Ошибка остановки бота: {str(e)}")
@@ -71,20 +295,38 @@ class SimpleTelegramMenuBot:
     async def _check_system_status(self):
         """Проверка статуса системы"""
         try:
-            # Простая проверка без базы данных для избежания ошибок
-            self.logger.info("📊 Система BetBog активна и мониторит live матчи")
+            today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+            async with AsyncSessionFactory() as session:
+                # Оба счетчика за один запрос (условная агрегация)
+                active_signals, today_signals = (await session.execute(
+                    select(
+                        func.count().filter(Signal.result == "pending").label("active"),
+                        func.count().filter(Signal.created_at >= today_start).label("today")
+                    )
+                )).one()
+
+            self.logger.info(
+                f"📊 Система BetBog активна: активных сигналов {active_signals}, за сегодня {today_signals}"
+            )
         except Exception as e:
             self.logger.error(f"Ошибка проверки статуса: {str(e)}")
 
+    def notify_signal_created(self):
+        """Сообщить циклу мониторинга о новом сигнале или результате"""
+        self._status_event.set()
+
     async def _monitoring_loop(self):
-        """Цикл мониторинга системы"""
+        """Цикл мониторинга системы: проверка статуса только по событию"""
         while self.running:
-            await asyncio.sleep(30)  # Проверяем каждые 30 секунд
+            await self._status_event.wait()
+            self._status_event.clear()
+            if not self.running:
+                break
             await self._check_system_status()
 
     async def _process_updates(self):
         """Обработка входящих сообщений от Telegram"""
-        import aiohttp
         last_update_id = 0
         
         while self.running:
@@ -130,7 +372,6 @@ class SimpleTelegramMenuBot:
 
     async def _send_message(self, chat_id: int, text: str):
         """Отправка сообщения пользователю"""
-        import aiohttp
         try:
             url = f"https://api.telegram.org/bot{self.config.BOT_TOKEN}/sendMessage"
             data = {"chat_id": chat_id, "text": text, "parse_mode": "HTML"}
@@ -167,7 +408,7 @@ class SimpleTelegramMenuBot:
         """Отправка статуса системы"""
         session = None
         try:
-            session = AsyncSessionLocal()
+            session = AsyncSessionFactory()
             
             # Получаем статистику
             total_signals = await session.scalar(select(func.count(Signal.id)))
@@ -198,21 +439,25 @@ class SimpleTelegramMenuBot:
         """Отправка активных сигналов"""
         session = None
         try:
-            session = AsyncSessionLocal()
+            session = AsyncSessionFactory()
             
-            # Получаем последние сигналы
+            # Получаем последние сигналы (только отображаемые колонки)
             signals = await session.execute(
-                select(Signal).where(Signal.result == "pending")
+                select(Signal.strategy_name, Signal.confidence, Signal.signal_type)
+                .where(Signal.result == "pending")
                 .order_by(desc(Signal.created_at)).limit(5)
             )
-            signals_list = signals.scalars().all()
+            signals_list = signals.all()
             
             if signals_list:
-                message = "🎯 <b>Активные сигналы:</b>\n\n"
-                for signal in signals_list:
-                    message += f"⚡ {signal.strategy_name}\n"
-                    message += f"📊 Уверенность: {signal.confidence:.1%}\n"
-                    message += f"🎰 Ставка: {signal.bet_type}\n\n"
+                parts = ["🎯 <b>Активные сигналы:</b>\n\n"]
+                for strategy_name, confidence, bet_type in signals_list:
+                    parts.append(
+                        f"⚡ {strategy_name}\n"
+                        f"📊 Уверенность: {confidence:.1%}\n"
+                        f"🎰 Ставка: {bet_type}\n\n"
+                    )
+                message = "".join(parts)
             else:
                 message = "📭 Нет активных сигналов в данный момент"
                 
@@ -259,11 +504,33 @@ BetBog - интеллектуальная система для монитори
         
         await self._send_message(chat_id, message)
 
+    def _enqueue_notification(self, text: str):
+        """Поставить уведомление в очередь; отправку выполняет фоновый обработчик"""
+        self._outbox.put_nowait(text)
+        if self._outbox_worker is None or self._outbox_worker.done():
+            self._outbox_worker = asyncio.create_task(self._notification_worker())
+
+    async def _notification_worker(self):
+        """Отправка уведомлений пачками с ограничением частоты (token bucket)"""
+        while True:
+            batch = [await self._outbox.get()]
+            while len(batch) < _NOTIFY_RATE_LIMIT and not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+
+            try:
+                await self._rate_limiter.acquire(len(batch))
+                _write_console("\n".join(batch))
+            except Exception as e:
+                self.logger.error(f"Ошибка отправки уведомлений: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+
     async def send_signal_notification(self, signal_data: Dict[str, Any], match_data: Dict[str, Any]):
         """Отправить уведомление о новом сигнале"""
         try:
             confidence = signal_data.get('confidence', 0)
-            confidence_emoji = "🔥" if confidence > 0.8 else "⚡" if confidence > 0.6 else "📈"
+            confidence_emoji = _confidence_emoji(confidence)
             
             # Логируем уведомление как консольное сообщение с красивым форматированием
             self.logger.strategy_signal(
@@ -274,167 +541,174 @@ BetBog - интеллектуальная система для монитори
             )
             
             # Подробное уведомление
-            notification_text = f"""
-╭─────────────────────────────────────────╮
-│           🎯 НОВЫЙ СИГНАЛ СТАВКИ          │
-╰─────────────────────────────────────────╯
-
-{confidence_emoji} Стратегия: {signal_data.get('strategy_name', 'Unknown')}
-⚽ Матч: {match_data.get('home_team', 'Unknown')} vs {match_data.get('away_team', 'Unknown')}
-🎯 Тип: {signal_data.get('signal_type', 'Unknown')}
-📊 Уверенность: {confidence:.1%}
-💰 Размер ставки: {signal_data.get('bet_size', 0):.2f}
-⏰ Время: {datetime.now().strftime('%H:%M:%S')}
-
-📈 Ключевые метрики:
-• dxG: {signal_data.get('details', {}).get('dxg_home', 0):.2f} - {signal_data.get('details', {}).get('dxg_away', 0):.2f}
-• Momentum: {signal_data.get('details', {}).get('momentum', 0):.2f}
-• Минута: {match_data.get('minute', 0)}'
-
-📋 Меню команд: /menu | Сигналы: /signals | Статистика: /stats
-            """
+            details = signal_data.get('details', {})
+            notification_text = _SIGNAL_NOTIFICATION_TEMPLATE.format_map({
+                'confidence_emoji': confidence_emoji,
+                'strategy_name': signal_data.get('strategy_name', 'Unknown'),
+                'home_team': match_data.get('home_team', 'Unknown'),
+                'away_team': match_data.get('away_team', 'Unknown'),
+                'signal_type': signal_data.get('signal_type', 'Unknown'),
+                'confidence': confidence,
+                'bet_size': signal_data.get('bet_size', 0),
+                'time': _cached_hms(int(time.time())),
+                'dxg_home': details.get('dxg_home', 0),
+                'dxg_away': details.get('dxg_away', 0),
+                'momentum': details.get('momentum', 0),
+                'minute': match_data.get('minute', 0)
+            })
             
-            print(notification_text)
-            self.logger.success("📱 Уведомление о сигнале отправлено")
+            self._enqueue_notification(notification_text)
+            self.notify_signal_created()
+            self.logger.success("📱 Уведомление о сигнале поставлено в очередь")
             
         except Exception as e:
             self.logger.error(f"Ошибка отправки уведомления: {str(e)}")
 
     async def show_main_menu(self):
         """Показать главное меню"""
-        menu_text = """
-╭─────────────────────────────────────────╮
-│         📋 BetBog Главное Меню           │
-╰─────────────────────────────────────────╯
-
-🟢 Система активна и мониторит матчи
-📊 7 стратегий анализируют данные
-🎯 Поиск сигналов в реальном времени
-
-📱 Доступные команды:
-
-🎯 /signals - Активные сигналы ставок
-📊 /stats - Статистика и P&L
-⚽ /matches - Live матчи  
-🔧 /strategies - Стратегии
-📈 /performance - Производительность
-⚙️ /settings - Настройки
-❓ /help - Помощь
-
-Введите команду для навигации по меню.
-        """
-        
-        print(menu_text)
+        _write_console(_MAIN_MENU_TEXT)
         self.logger.info("📋 Показано главное меню")
 
+    async def _fetch_all(self, stmt) -> List[Any]:
+        """Выполнить запрос в отдельной сессии и вернуть все строки"""
+        async with AsyncSessionFactory() as session:
+            return (await session.execute(stmt)).all()
+
+    async def _get_stats(self, key: str, loader):
+        """Вернуть агрегаты из кэша или загрузить их, объединяя одновременные запросы"""
+        cached = self._stats_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+            return cached[1]
+
+        async with self._stats_lock:
+            # Пока ждали блокировку, кэш мог обновить другой вызов
+            cached = self._stats_cache.get(key)
+            if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+                return cached[1]
+
+            payload = await loader()
+            self._stats_cache[key] = (time.monotonic(), payload)
+            return payload
+
+    async def _load_signals_payload(self):
+        """Загрузить счетчики сигналов и последние активные сигналы"""
+        # Статистика сигналов одним запросом (условная агрегация)
+        stats_stmt = select(
+            func.count(Signal.id),
+            func.count().filter(Signal.result == "pending"),
+            func.count().filter(Signal.result == "won"),
+            func.count().filter(Signal.result == "lost")
+        )
+
+        # Последние активные сигналы (только отображаемые колонки)
+        list_stmt = (
+            select(
+                Signal.strategy_name,
+                Signal.signal_type,
+                Signal.confidence,
+                Signal.stake.label("bet_size")
+            )
+            .where(Signal.result == "pending")
+            .order_by(desc(Signal.created_at))
+            .limit(5)
+        )
+
+        # Оба запроса параллельно на разных соединениях пула
+        stats_rows, signals_list = await asyncio.gather(
+            self._fetch_all(stats_stmt),
+            self._fetch_all(list_stmt)
+        )
+        return stats_rows[0], signals_list
+
     async def show_signals_menu(self):
         """Показать меню сигналов"""
         try:
-            session = get_session()
-            async with session:
-                # Получаем статистику сигналов
-                total_signals = await session.scalar(select(func.count(Signal.id)))
-                active_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "pending")
-                )
-                won_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "won")
-                )
-                lost_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "lost")
-                )
+            counts, signals_list = await self._get_stats("signals", self._load_signals_payload)
+            total_signals, active_signals, won_signals, lost_signals = counts
 
-                # Получаем последние активные сигналы
-                stmt = (
-                    select(Signal)
-                    .where(Signal.result == "pending")
-                    .order_by(desc(Signal.created_at))
-                    .limit(5)
-                )
-                signals = await session.scalars(stmt)
-                signals_list = list(signals)
-
-            signals_text = f"""
-╭─────────────────────────────────────────╮
-│           🎯 Сигналы BetBog              │
-╰─────────────────────────────────────────╯
-
-📊 Общая статистика:
-• Всего сигналов: {total_signals or 0}
-• Активных: {active_signals or 0}
-• Выиграно: {won_signals or 0} 
-• Проиграно: {lost_signals or 0}
-• Winrate: {(won_signals / max(won_signals + lost_signals, 1) * 100):.1f}%
-
-🔴 Активные сигналы:
-            """
+            parts = [_SIGNALS_HEADER_TEMPLATE.format_map({
+                'total': total_signals or 0,
+                'active': active_signals or 0,
+                'won': won_signals or 0,
+                'lost': lost_signals or 0,
+                'winrate': won_signals / max(won_signals + lost_signals, 1) * 100
+            })]
 
             if not signals_list:
-                signals_text += "\n❌ Нет активных сигналов"
+                parts.append("\n❌ Нет активных сигналов")
             else:
                 for i, signal in enumerate(signals_list, 1):
-                    confidence_emoji = "🔥" if signal.confidence > 0.8 else "⚡" if signal.confidence > 0.6 else "📈"
-                    signals_text += f"""
+                    confidence_emoji = _confidence_emoji(signal.confidence)
+                    parts.append(f"""
 {i}. {confidence_emoji} {signal.strategy_name}
    📊 {signal.signal_type} | {signal.confidence:.1%}
    💰 Размер: {signal.bet_size:.2f}
-                    """
+                    """)
 
-            signals_text += "\n\n📱 Команды: /menu - Главное меню | /stats - Статистика"
+            parts.append(_SIGNALS_FOOTER)
+            signals_text = "".join(parts)
             
-            print(signals_text)
+            _write_console(signals_text)
             self.logger.info("🎯 Показано меню сигналов")
             
         except Exception as e:
             self.logger.error(f"Ошибка показа сигналов: {str(e)}")
 
+    async def _load_stats_payload(self):
+        """Загрузить агрегаты P&L и winrate на стороне БД и посчитать просадку"""
+        completed = Signal.result.in_(("won", "lost"))
+
+        # Счетчики и сумма P&L одним запросом (CASE WHEN на стороне сервера)
+        agg_stmt = select(
+            func.count(Signal.id),
+            func.sum(Signal.profit_loss),
+            func.sum(case((Signal.result == "won", 1), else_=0)),
+            func.sum(case((completed, 1), else_=0))
+        )
+
+        # Для просадки нужен только ряд P&L завершенных сигналов по времени
+        pnl_stmt = select(Signal.profit_loss).where(completed).order_by(Signal.created_at)
+
+        agg_rows, pnl_rows = await asyncio.gather(
+            self._fetch_all(agg_stmt),
+            self._fetch_all(pnl_stmt)
+        )
+        total_signals, total_pnl, won_signals, completed_signals = agg_rows[0]
+
+        pnls = np.fromiter((r.profit_loss or 0.0 for r in pnl_rows), dtype=np.float64, count=len(pnl_rows))
+        return (
+            total_signals or 0,
+            total_pnl or 0.0,
+            won_signals or 0,
+            completed_signals or 0,
+            _max_drawdown(pnls)
+        )
+
     async def show_stats_menu(self):
         """Показать статистику"""
         try:
-            async with get_session() as session:
-                # Базовая статистика
-                total_signals = await session.scalar(select(func.count(Signal.id)))
-                won_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "won")
-                )
-                lost_signals = await session.scalar(
-                    select(func.count(Signal.id)).where(Signal.result == "lost")
-                )
-                
-                # P&L
-                total_pnl_result = await session.scalar(
-                    select(func.sum(Signal.profit_loss)).where(Signal.profit_loss.isnot(None))
-                )
-                total_pnl = total_pnl_result or 0
-                
-                completed_signals = (won_signals or 0) + (lost_signals or 0)
-                winrate = (won_signals / completed_signals * 100) if completed_signals > 0 else 0
-
-            stats_text = f"""
-╭─────────────────────────────────────────╮
-│          📊 Статистика BetBog            │
-╰─────────────────────────────────────────╯
-
-📈 Общие показатели:
-• Всего сигналов: {total_signals or 0}
-• Завершено: {completed_signals}
-• Выиграно: {won_signals or 0}
-• Проиграно: {lost_signals or 0}
-• Winrate: {winrate:.1f}%
-
-💰 Финансовые показатели:
-• Общий P&L: {total_pnl:+.2f}
-• ROI: {(total_pnl / max(completed_signals, 1) * 100):+.1f}%
-• Средний результат: {(total_pnl / max(completed_signals, 1)):.2f}
-
-🎯 Производительность:
-• Активность: {(total_signals or 0) / max(1, 7):.1f} сигналов/день
-• Эффективность: {'Высокая' if winrate > 60 else 'Средняя' if winrate > 45 else 'Требует улучшения'}
+            total_signals, total_pnl, won_signals, completed_signals, max_drawdown = await self._get_stats(
+                "stats", self._load_stats_payload
+            )
 
-📱 Команды: /menu - Главное меню | /signals - Сигналы
-            """
+            lost_signals = completed_signals - won_signals
+            winrate = (won_signals / completed_signals * 100) if completed_signals > 0 else 0
+
+            stats_text = _STATS_TEMPLATE.format_map({
+                'total_signals': total_signals or 0,
+                'completed_signals': completed_signals,
+                'won_signals': won_signals or 0,
+                'lost_signals': lost_signals or 0,
+                'winrate': winrate,
+                'total_pnl': total_pnl,
+                'roi': total_pnl / max(completed_signals, 1) * 100,
+                'avg_result': total_pnl / max(completed_signals, 1),
+                'max_drawdown': max_drawdown,
+                'activity': (total_signals or 0) / max(1, 7),
+                'efficiency': 'Высокая' if winrate > 60 else 'Средняя' if winrate > 45 else 'Требует улучшения'
+            })
             
-            print(stats_text)
+            _write_console(stats_text)
             self.logger.info("📊 Показана статистика")
             
         except Exception as e:
@@ -443,34 +717,42 @@ BetBog - интеллектуальная система для монитори
     async def show_matches_menu(self):
         """Показать live матчи"""
         try:
-            async with get_session() as session:
-                # Получаем последние матчи
-                stmt = select(Match).order_by(desc(Match.updated_at)).limit(10)
-                matches = await session.scalars(stmt)
-                matches_list = list(matches)
+            async with AsyncSessionFactory() as session:
+                # Получаем последние матчи (только отображаемые колонки)
+                stmt = (
+                    select(
+                        Match.home_team,
+                        Match.away_team,
+                        Match.home_score,
+                        Match.away_score,
+                        Match.minute,
+                        Match.league,
+                        Match.status
+                    )
+                    .order_by(desc(Match.updated_at))
+                    .limit(10)
+                )
+                matches_list = (await session.execute(stmt)).all()
 
-            matches_text = """
-╭─────────────────────────────────────────╮
-│           ⚽ Live Матчи                   │
-╰─────────────────────────────────────────╯
-            """
+            parts = [_MATCHES_HEADER]
 
             if not matches_list:
-                matches_text += "\n❌ Нет активных матчей"
+                parts.append("\n❌ Нет активных матчей")
             else:
-                matches_text += f"\n📊 Найдено {len(matches_list)} матчей:\n"
+                parts.append(f"\n📊 Найдено {len(matches_list)} матчей:\n")
                 
                 for i, match in enumerate(matches_list[:5], 1):
                     status = "🔴 LIVE" if match.status == "live" else "⚪ Завершен"
-                    matches_text += f"""
+                    parts.append(f"""
 {i}. {status} {match.home_team} vs {match.away_team}
    📊 Счет: {match.home_score}:{match.away_score} | {match.minute}'
    🏆 Лига: {match.league}
-                    """
+                    """)
 
-            matches_text += "\n\n📱 Команды: /menu - Главное меню | /signals - Сигналы"
+            parts.append(_MATCHES_FOOTER)
+            matches_text = "".join(parts)
             
-            print(matches_text)
+            _write_console(matches_text)
             self.logger.info("⚽ Показаны live матчи")
             
         except Exception as e:
@@ -478,77 +760,30 @@ BetBog - интеллектуальная система для монитори
 
     async def show_help_menu(self):
         """Показать помощь"""
-        help_text = """
-╭─────────────────────────────────────────╮
-│           ❓ Помощь BetBog               │
-╰─────────────────────────────────────────╯
-
-🤖 BetBog - система мониторинга ставок
-
-📱 Основные команды:
-• /start, /menu - Главное меню
-• /signals - Активные сигналы
-• /stats - Статистика и P&L
-• /matches - Live матчи
-• /strategies - Стратегии системы
-• /performance - Производительность
-• /settings - Настройки
-• /help - Эта справка
-
-🎯 Функции системы:
-• Анализ live футбольных матчей
-• 7 адаптивных стратегий ставок
-• Расчет продвинутых метрик (dxG, momentum, gradient)
-• Отслеживание P&L и статистики
-• Уведомления о новых сигналах
-
-📊 Метрики:
-• dxG - derived Expected Goals
-• Gradient - тренд производительности  
-• Momentum - импульс команд
-• Wave - амплитуда интенсивности
-• Tiredness - фактор усталости
-
-🔧 Стратегии:
-• DxG Hunter - поиск высокого xG
-• Momentum Rider - игра на импульсе
-• Wave Catcher - анализ волн
-• Late Drama - поздние голы
-• Comeback King - камбэки
-• Defensive Wall - оборонительная игра
-• Quick Strike - быстрые голы
-
-Система работает 24/7 с реальными данными от bet365 API!
-
-📱 Команда: /menu - Вернуться в главное меню
-        """
-        
-        print(help_text)
+        _write_console(_HELP_TEXT)
         self.logger.info("❓ Показана справка")
 
     # Методы для совместимости с основной системой
     async def send_result_notification(self, signal_data: Dict[str, Any], match_data: Dict[str, Any], result: str, profit_loss: float):
         """Отправить уведомление о результате"""
         try:
-            result_emoji = "✅" if result == "won" else "❌" if result == "lost" else "⏳"
-            pnl_emoji = "💚" if profit_loss > 0 else "❤️" if profit_loss < 0 else "💛"
+            result_emoji = _RESULT_EMOJIS.get(result, "⏳")
+            pnl_emoji = _PNL_EMOJIS[(profit_loss > 0) - (profit_loss < 0) + 1]
             
-            notification_text = f"""
-╭─────────────────────────────────────────╮
-│        📈 РЕЗУЛЬТАТ СИГНАЛА              │
-╰─────────────────────────────────────────╯
-
-{result_emoji} Результат: {result.upper()}
-🎯 Стратегия: {signal_data.get('strategy_name', 'Unknown')}
-⚽ Матч: {match_data.get('home_team', 'Unknown')} vs {match_data.get('away_team', 'Unknown')}
-{pnl_emoji} P&L: {profit_loss:+.2f}
-⏰ Время: {datetime.now().strftime('%H:%M:%S')}
-
-📱 Команды: /menu | /signals | /stats
-            """
+            notification_text = _RESULT_NOTIFICATION_TEMPLATE.format_map({
+                'result_emoji': result_emoji,
+                'result': result.upper(),
+                'strategy_name': signal_data.get('strategy_name', 'Unknown'),
+                'home_team': match_data.get('home_team', 'Unknown'),
+                'away_team': match_data.get('away_team', 'Unknown'),
+                'pnl_emoji': pnl_emoji,
+                'profit_loss': profit_loss,
+                'time': _cached_hms(int(time.time()))
+            })
             
-            print(notification_text)
-            self.logger.success(f"📱 Уведомление о результате отправлено: {result}")
+            self._enqueue_notification(notification_text)
+            self.notify_signal_created()
+            self.logger.success(f"📱 Уведомление о результате поставлено в очередь: {result}")
             
         except Exception as e:
             self.logger.error(f"Ошибка отправки уведомления о результате: {str(e)}")
@@ -1,9 +1,19 @@
+import asyncio
 import json
-import statistics
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple, Optional
 from logger import BetBogLogger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+def _confidence_array(signals: List[Dict]) -> np.ndarray:
+    """Signal confidences as a contiguous float array (empty for no signals)"""
+    return np.fromiter((s.get('confidence', 0.5) for s in signals), dtype=np.float64, count=len(signals))
+
 class SimpleOptimizer:
     """Simple statistical optimizer for betting strategies without ML dependencies"""
     
@@ -33,16 +43,21 @@ class SimpleOptimizer:
                 return {}
             
             # Calculate optimal thresholds based on winning patterns
-            optimal_thresholds = self._calculate_statistical_thresholds(
+            # (CPU-bound, so run it off the event loop)
+            optimal_thresholds = await asyncio.to_thread(
+                self._calculate_statistical_thresholds,
                 win_signals, loss_signals, strategy_name
             )
             
+            win_confidences = _confidence_array(win_signals)
+            loss_confidences = _confidence_array(loss_signals)
+            
             # Store performance data
             self.strategy_stats[strategy_name] = {
                 'win_rate': len(win_signals) / len(historical_signals),
                 'total_signals': len(historical_signals),
-                'avg_confidence_wins': statistics.mean([s.get('confidence', 0.5) for s in win_signals]),
-                'avg_confidence_losses': statistics.mean([s.get('confidence', 0.5) for s in loss_signals]) if loss_signals else 0,
+                'avg_confidence_wins': float(win_confidences.mean()),
+                'avg_confidence_losses': float(loss_confidences.mean()) if loss_confidences.size else 0,
                 'last_optimized': datetime.now().isoformat()
             }
             
@@ -62,14 +77,29 @@ class SimpleOptimizer:
         thresholds = {}
         
         try:
+            # Single pass over winning signals into parallel arrays (SoA)
+            n_wins = len(win_signals)
+            win_confidences = np.empty(n_wins, dtype=np.float64)
+            win_dxg_values = np.empty(n_wins, dtype=np.float64)
+            win_momentum_diffs = np.empty(n_wins, dtype=np.float64)
+            win_tiredness_diffs = np.empty(n_wins, dtype=np.float64)
+            win_minutes = np.empty(n_wins, dtype=np.int64)
+            
+            for i, signal in enumerate(win_signals):
+                metrics = signal.get('trigger_metrics') or {}
+                win_confidences[i] = signal.get('confidence', 0.5)
+                win_dxg_values[i] = metrics.get('total_dxg', 0)
+                win_momentum_diffs[i] = metrics.get('momentum_diff', 0)
+                win_tiredness_diffs[i] = metrics.get('tiredness_diff', 0)
+                win_minutes[i] = signal.get('trigger_minute', 45)
+            
             # Confidence threshold optimization
-            win_confidences = [s.get('confidence', 0.5) for s in win_signals]
-            loss_confidences = [s.get('confidence', 0.5) for s in loss_signals]
+            loss_confidences = _confidence_array(loss_signals)
             
-            if win_confidences and loss_confidences:
+            if win_confidences.size and loss_confidences.size:
                 # Find confidence threshold that maximizes precision
-                avg_win_conf = statistics.mean(win_confidences)
-                avg_loss_conf = statistics.mean(loss_confidences)
+                avg_win_conf = float(win_confidences.mean())
+                avg_loss_conf = float(loss_confidences.mean())
                 
                 # Set threshold slightly below average winning confidence
                 optimal_confidence = max(0.6, avg_win_conf - 0.05)
@@ -78,50 +108,34 @@ class SimpleOptimizer:
             # Strategy-specific threshold optimization
             if strategy_name == 'dxg_spike':
                 # Analyze dxG values from winning signals
-                win_dxg_values = []
-                for signal in win_signals:
-                    metrics = signal.get('trigger_metrics', {})
-                    total_dxg = metrics.get('total_dxg', 0)
-                    if total_dxg > 0:
-                        win_dxg_values.append(total_dxg)
+                positive_dxg = win_dxg_values[win_dxg_values > 0]
                 
-                if win_dxg_values:
-                    # Use 25th percentile of winning dxG values as threshold
-                    sorted_values = sorted(win_dxg_values)
-                    percentile_25 = sorted_values[len(sorted_values) // 4]
+                if positive_dxg.size:
+                    # Use 25th percentile of winning dxG values as threshold (O(n) selection)
+                    k = positive_dxg.size // 4
+                    percentile_25 = float(np.partition(positive_dxg, k)[k])
                     thresholds['threshold'] = round(max(0.1, percentile_25 * 0.8), 3)
                 
             elif strategy_name == 'momentum_shift':
                 # Analyze momentum differences
-                win_momentum_diffs = []
-                for signal in win_signals:
-                    metrics = signal.get('trigger_metrics', {})
-                    momentum_diff = metrics.get('momentum_diff', 0)
-                    if momentum_diff > 0:
-                        win_momentum_diffs.append(momentum_diff)
+                positive_momentum = win_momentum_diffs[win_momentum_diffs > 0]
                 
-                if win_momentum_diffs:
-                    avg_momentum = statistics.mean(win_momentum_diffs)
+                if positive_momentum.size:
+                    avg_momentum = float(positive_momentum.mean())
                     thresholds['threshold'] = round(max(0.15, avg_momentum * 0.7), 3)
                     
             elif strategy_name == 'tiredness_advantage':
                 # Analyze tiredness differences
-                win_tiredness_diffs = []
-                for signal in win_signals:
-                    metrics = signal.get('trigger_metrics', {})
-                    tiredness_diff = metrics.get('tiredness_diff', 0)
-                    if tiredness_diff > 0:
-                        win_tiredness_diffs.append(tiredness_diff)
+                positive_tiredness = win_tiredness_diffs[win_tiredness_diffs > 0]
                 
-                if win_tiredness_diffs:
-                    avg_tiredness = statistics.mean(win_tiredness_diffs)
+                if positive_tiredness.size:
+                    avg_tiredness = float(positive_tiredness.mean())
                     thresholds['threshold'] = round(max(0.2, avg_tiredness * 0.8), 3)
             
             # Add time-based optimization
-            win_minutes = [s.get('trigger_minute', 45) for s in win_signals]
-            if win_minutes:
-                optimal_min_minute = min(win_minutes) + 5  # Buffer
-                optimal_max_minute = max(win_minutes) - 5  # Buffer
+            if win_minutes.size:
+                optimal_min_minute = int(win_minutes.min()) + 5  # Buffer
+                optimal_max_minute = int(win_minutes.max()) - 5  # Buffer
                 thresholds['min_minute'] = max(15, optimal_min_minute)
                 thresholds['max_minute'] = min(80, optimal_max_minute)
             
@@ -205,8 +219,13 @@ class SimpleOptimizer:
                 'timestamp': datetime.now().isoformat()
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(data, indent=2).encode()
+            
+            with open(filepath, 'wb') as f:
+                f.write(payload)
             
             self.logger.success(f"Optimization data saved to {filepath}")
             
@@ -216,8 +235,9 @@ class SimpleOptimizer:
     def load_models(self, filepath: str):
         """Load optimization data from file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             self.strategy_stats = data.get('strategy_stats', {})
             self.threshold_history = data.get('threshold_history', {})
@@ -1,11 +1,20 @@
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from bisect import bisect_left
+from types import MethodType
 import math
+from math import fabs
+import numpy as np
 from metrics_calculator import MatchMetrics
 from logger import BetBogLogger
+from strategies_kernels import (
+    NUMBA_AVAILABLE, SCORE_ALL_COLUMNS, TIME_FACTOR_LUT, recommended_odds, score_all,
+    score_over_2_5, score_under_2_5, score_momentum_shift, score_next_goal_away
+)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignalResult:
     """Result of strategy analysis"""
     strategy_name: str
@@ -13,10 +22,199 @@ class SignalResult:
     confidence: float
     prediction: str
     threshold_used: float
-    reasoning: str
-    trigger_metrics: Dict[str, float]
+    reasoning_template: str
+    reasoning_args: Tuple[Any, ...]
+    trigger_keys: Tuple[str, ...]
+    trigger_values: Tuple[Any, ...]
     recommended_odds: float = 0.0
     stake_multiplier: float = 1.0
+    _trigger_metrics: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def trigger_metrics(self) -> Dict[str, Any]:
+        """Trigger metrics as a dict, built on first access"""
+        if self._trigger_metrics is None:
+            object.__setattr__(self, "_trigger_metrics", dict(zip(self.trigger_keys, self.trigger_values)))
+        return self._trigger_metrics
+
+    @property
+    def reasoning(self) -> str:
+        """Human-readable reasoning, formatted only when displayed or logged"""
+        return self.reasoning_template % self.reasoning_args
+
+# Names of the trigger metric values each strategy reports, in order
+_DXG_SPIKE_TRIGGERS = ("total_dxg", "dxg_imbalance", "minute")
+_UNDER_2_5_GOALS_TRIGGERS = ("total_attacks", "total_shots", "total_dxg", "minute")
+_MOMENTUM_SHIFT_TRIGGERS = ("momentum_home", "momentum_away", "momentum_diff", "leading_team")
+_NEXT_GOAL_AWAY_TRIGGERS = ("away_momentum", "away_efficiency", "momentum_diff", "minute")
+
+# Strategies that only fire when minute > gate, used to skip them early
+_STRATEGY_MINUTE_GATES = {
+    "over_2_5_goals": 20,
+    "momentum_shift": 15,
+    "wave_pattern": 20,
+    "stability_disruption": 30
+}
+
+# Signal ids returned by the scoring kernels, 0 means no signal
+_DXG_SIGNAL_TYPES = (None, "over_2.5", "over_1.5", "btts")
+_MOMENTUM_SIGNAL_TYPES = (None, "first_goal", "next_goal")
+
+# Team side is tracked as an index and only turned into text for SignalResult
+HOME, AWAY = 0, 1
+TEAM_NAMES = ("home", "away")
+_MOMENTUM_PREDICTIONS = {
+    "first_goal": ("First goal by home team", "First goal by away team"),
+    "next_goal": ("Next goal by home team", "Next goal by away team")
+}
+
+class DerivedMetrics(NamedTuple):
+    """Per-match aggregates shared by several strategies, computed once per tick"""
+    total_score: int
+    total_dxg: float
+    dxg_imbalance: float
+    total_attacks: int
+    total_shots: int
+    momentum_diff: float  # away minus home
+    abs_momentum_sum: float
+
+def _derived_metrics(metrics: MatchMetrics, match_data: Dict[str, Any]) -> DerivedMetrics:
+    return DerivedMetrics(
+        total_score=match_data.get('home_score', 0) + match_data.get('away_score', 0),
+        total_dxg=metrics.dxg_home + metrics.dxg_away,
+        dxg_imbalance=fabs(metrics.dxg_home - metrics.dxg_away),
+        total_attacks=metrics.attacks_home + metrics.attacks_away,
+        total_shots=metrics.shots_home + metrics.shots_away,
+        momentum_diff=metrics.momentum_away - metrics.momentum_home,
+        abs_momentum_sum=fabs(metrics.momentum_home) + fabs(metrics.momentum_away)
+    )
+
+# Factories for the active analyzers with their config thresholds bound as
+# closure constants; BettingStrategies rebuilds them when the config changes
+
+def _make_over_2_5_goals(build_signal, threshold: float, min_confidence: float):
+    def analyze(metrics, match_data, minute, derived=None):
+        if derived is None:
+            derived = _derived_metrics(metrics, match_data)
+        
+        signal_id, final_confidence = score_over_2_5(
+            derived.total_dxg, derived.dxg_imbalance, derived.abs_momentum_sum,
+            minute, threshold, min_confidence
+        )
+        if not signal_id:
+            return None
+        
+        return build_signal(_DXG_SIGNAL_TYPES[signal_id], final_confidence, threshold,
+                            derived.total_dxg, derived.dxg_imbalance, minute)
+    return analyze
+
+def _make_under_2_5_goals(build_signal, threshold: float, min_confidence: float):
+    def analyze(metrics, match_data, minute, derived=None):
+        if derived is None:
+            derived = _derived_metrics(metrics, match_data)
+        
+        signal_id, final_confidence = score_under_2_5(
+            derived.total_attacks, derived.total_shots, derived.total_dxg, minute, threshold, min_confidence
+        )
+        if not signal_id:
+            return None
+        
+        return build_signal(final_confidence, threshold, derived.total_attacks,
+                            derived.total_shots, derived.total_dxg, minute)
+    return analyze
+
+def _make_momentum_shift(build_signal, threshold: float, stability_factor: float):
+    def analyze(metrics, match_data, minute, derived=None):
+        if derived is None:
+            derived = _derived_metrics(metrics, match_data)
+        
+        signal_id, final_confidence = score_momentum_shift(
+            metrics.momentum_home, metrics.momentum_away, derived.momentum_diff,
+            metrics.stability_home, metrics.stability_away, minute, derived.total_score,
+            threshold, stability_factor
+        )
+        if not signal_id:
+            return None
+        
+        return build_signal(_MOMENTUM_SIGNAL_TYPES[signal_id], final_confidence, threshold,
+                            metrics.momentum_home, metrics.momentum_away)
+    return analyze
+
+def _make_next_goal_away(build_signal, threshold: float, min_confidence: float):
+    def analyze(metrics, match_data, minute, derived=None):
+        if derived is None:
+            derived = _derived_metrics(metrics, match_data)
+        
+        signal_id, final_confidence = score_next_goal_away(
+            metrics.momentum_away, derived.momentum_diff, metrics.shots_per_attack_away,
+            metrics.attacks_home, metrics.attacks_away, metrics.shots_home, metrics.shots_away,
+            minute, threshold, min_confidence
+        )
+        if not signal_id:
+            return None
+        
+        return build_signal(final_confidence, threshold, metrics.momentum_away,
+                            metrics.shots_per_attack_away, derived.momentum_diff, minute)
+    return analyze
+
+# Compiled odds kernel behind a memo: confidences are published with 3 digits,
+# so there are at most ~1000 distinct keys per margin tier
+_recommended_odds = lru_cache(maxsize=2048)(recommended_odds)
+
+class MatchMetricsBatch:
+    """Struct-of-arrays view of MatchMetrics for batch strategy evaluation
+
+    Buffers are allocated once and refilled in place on every update;
+    public attributes are views over the first `size` rows.
+    """
+
+    FLOAT_FIELDS = (
+        "dxg_home", "dxg_away",
+        "momentum_home", "momentum_away",
+        "stability_home", "stability_away",
+        "shots_per_attack_home", "shots_per_attack_away"
+    )
+    COUNT_FIELDS = ("attacks_home", "attacks_away", "shots_home", "shots_away")
+
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._reserve(capacity)
+        self._bind_views()
+
+    @classmethod
+    def from_metrics(cls, metrics_list: List[MatchMetrics]) -> "MatchMetricsBatch":
+        """Build a batch sized for the given metrics"""
+        batch = cls(len(metrics_list))
+        batch.update(metrics_list)
+        return batch
+
+    def __len__(self) -> int:
+        return self.size
+
+    def update(self, metrics_list: List[MatchMetrics]):
+        """Refill the batch from a list of MatchMetrics (one row per match)"""
+        self.size = len(metrics_list)
+        self._reserve(self.size)
+
+        for field, buffer in self._buffers.items():
+            buffer[:self.size] = [getattr(metrics, field) for metrics in metrics_list]
+
+        self._bind_views()
+
+    def _reserve(self, capacity: int):
+        """Grow the underlying buffers if they can't hold `capacity` rows"""
+        if self._buffers and len(self._buffers["dxg_home"]) >= capacity:
+            return
+
+        for field in self.FLOAT_FIELDS:
+            self._buffers[field] = np.zeros(capacity, dtype=np.float64)
+        for field in self.COUNT_FIELDS:
+            self._buffers[field] = np.zeros(capacity, dtype=np.int32)
+
+    def _bind_views(self):
+        for field, buffer in self._buffers.items():
+            setattr(self, field, buffer[:self.size])
 
 class BettingStrategies:
     """Advanced betting strategies with adaptive thresholds"""
@@ -30,6 +228,8 @@ class BettingStrategies:
             "momentum_shift": self.analyze_momentum_shift,
             "next_goal_away": self.analyze_next_goal_away
         }
+        self._register_experimental_strategies(config.get("enabled_experimental", False))
+        self._refresh_cached_thresholds()
     
     def analyze_all_strategies(self, 
                              current_metrics: MatchMetrics,
@@ -37,10 +237,14 @@ class BettingStrategies:
                              minute: int) -> List[SignalResult]:
         """Analyze all strategies and return signals"""
         signals = []
+        derived = _derived_metrics(current_metrics, match_data)
+        
+        # One bisect picks the strategies whose minute gate this minute passes
+        bucket = self._minute_buckets[bisect_left(self._minute_gates, minute)]
         
-        for strategy_name, strategy_func in self.strategies.items():
+        for strategy_name, strategy_func in bucket:
             try:
-                result = strategy_func(current_metrics, match_data, minute)
+                result = strategy_func(current_metrics, match_data, minute, derived)
                 if result and result.confidence > 0.5:  # Minimum confidence threshold
                     signals.append(result)
                     self.logger.info(f"Signal generated: {strategy_name} - {result.confidence:.2f}")
@@ -49,480 +253,414 @@ class BettingStrategies:
         
         return signals
     
-    def analyze_over_2_5_goals(self, metrics: MatchMetrics, match_data: Dict[str, Any], minute: int) -> Optional[SignalResult]:
-        """Analyze sudden spikes in derived xG for over/under signals"""
+    def _register_experimental_strategies(self, enabled):
+        """Add analyzers from strategies_experimental to the dispatch
+
+        `enabled` is True for all of them or a collection of strategy names.
+        """
+        if not enabled:
+            return
+        
+        from strategies_experimental import EXPERIMENTAL_STRATEGIES
+        
+        names = frozenset(EXPERIMENTAL_STRATEGIES) if enabled is True else frozenset(enabled)
+        for name in names - EXPERIMENTAL_STRATEGIES.keys():
+            self.logger.warning(f"Unknown experimental strategy: {name}")
         
-        config = self.config.get("dxg_spike", {})
-        threshold = config.get("threshold", 0.15)
-        min_confidence = config.get("min_confidence", 0.7)
-        
-        # Calculate total dxG and spike intensity
-        total_dxg = metrics.dxg_home + metrics.dxg_away
-        dxg_imbalance = abs(metrics.dxg_home - metrics.dxg_away)
-        
-        # Check for significant dxG levels
-        if total_dxg > threshold and minute > 20:
-            # Determine signal type based on dxG level and match context
-            if total_dxg > 1.5 and minute < 70:
-                signal_type = "over_2.5"
-                confidence = min(0.9, 0.5 + (total_dxg - 1.5) * 0.3)
-            elif total_dxg > 1.0 and minute < 60:
-                signal_type = "over_1.5"
-                confidence = min(0.85, 0.5 + (total_dxg - 1.0) * 0.4)
-            elif total_dxg > 0.8 and dxg_imbalance > 0.3:
-                signal_type = "btts"  # Both teams to score
-                confidence = min(0.8, 0.5 + dxg_imbalance * 0.5)
-            else:
-                return None
-            
-            # Adjust confidence based on time and momentum
-            time_factor = self._get_time_confidence_factor(minute)
-            momentum_factor = (abs(metrics.momentum_home) + abs(metrics.momentum_away)) * 0.1
-            
-            final_confidence = confidence * time_factor * (1 + momentum_factor)
-            
-            if final_confidence >= min_confidence:
-                return SignalResult(
-                    strategy_name="dxg_spike",
-                    signal_type=signal_type,
-                    confidence=round(final_confidence, 3),
-                    prediction=signal_type.replace("_", " ").title(),
-                    threshold_used=threshold,
-                    reasoning=f"dxG spike detected: {total_dxg:.2f} total, imbalance: {dxg_imbalance:.2f}",
-                    trigger_metrics={
-                        "total_dxg": total_dxg,
-                        "dxg_imbalance": dxg_imbalance,
-                        "minute": minute
-                    },
-                    recommended_odds=self._calculate_recommended_odds(signal_type, final_confidence),
-                    stake_multiplier=min(2.0, final_confidence + 0.5)
-                )
-        
-        return None
+        for name, analyzer in EXPERIMENTAL_STRATEGIES.items():
+            if name in names:
+                self.strategies[name] = MethodType(analyzer, self)
+    
+    def _build_minute_buckets(self):
+        """Group the dispatch tuple by the strategies' minute gates
+
+        Bucket k holds, in dispatch order, the strategies that can fire once
+        the minute is above the first k gates; strategies without a gate are
+        in every bucket.
+        """
+        self._minute_gates = sorted({
+            _STRATEGY_MINUTE_GATES[name] for name, _ in self._strategy_list if name in _STRATEGY_MINUTE_GATES
+        })
+        self._minute_buckets = tuple(
+            tuple(
+                (name, func) for name, func in self._strategy_list
+                if _STRATEGY_MINUTE_GATES.get(name, float("-inf")) < gate
+            )
+            for gate in self._minute_gates + [float("inf")]
+        )
+    
+    def analyze_over_2_5_goals(self, metrics: MatchMetrics, match_data: Dict[str, Any], minute: int,
+                               derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+        """Analyze sudden spikes in derived xG for over/under signals"""
+        return self._analyzers["over_2_5_goals"](metrics, match_data, minute, derived)
+
+    def _dxg_spike_signal(self, signal_type: str, final_confidence: float, threshold: float,
+                          total_dxg: float, dxg_imbalance: float, minute: int) -> SignalResult:
+        stake_multiplier = final_confidence + 0.5
+        return SignalResult(
+            strategy_name="dxg_spike",
+            signal_type=signal_type,
+            confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+            prediction=signal_type.replace("_", " ").title(),
+            threshold_used=threshold,
+            reasoning_template="dxG spike detected: %.2f total, imbalance: %.2f",
+            reasoning_args=(total_dxg, dxg_imbalance),
+            trigger_keys=_DXG_SPIKE_TRIGGERS,
+            trigger_values=(total_dxg, dxg_imbalance, minute),
+            recommended_odds=self._calculate_recommended_odds(signal_type, final_confidence),
+            stake_multiplier=stake_multiplier if stake_multiplier < 2.0 else 2.0
+        )
 
     def analyze_under_2_5_goals(self, 
                               metrics: MatchMetrics, 
                               match_data: Dict[str, Any], 
-                              minute: int) -> Optional[SignalResult]:
+                              minute: int,
+                              derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
         """Analyze under 2.5 goals signal - defensive play"""
-        
-        config = self.config.get("under_2_5_goals", {})
-        threshold = config.get("threshold", 0.6)
-        min_confidence = config.get("min_confidence", 0.65)
-        
-        # Check for defensive indicators
-        total_attacks = metrics.attacks_home + metrics.attacks_away
-        total_shots = metrics.shots_home + metrics.shots_away
-        total_dxg = metrics.dxg_home + metrics.dxg_away
-        
-        # Low attacking activity suggests under 2.5
-        attacking_factor = 1.0 - min(1.0, (total_attacks / 20.0 + total_shots / 15.0) / 2.0)
-        dxg_factor = 1.0 - min(1.0, total_dxg / 2.5)
-        
-        confidence = (attacking_factor * 0.6 + dxg_factor * 0.4)
-        
-        if confidence >= threshold:
-            time_factor = self._get_time_confidence_factor(minute)
-            final_confidence = confidence * time_factor
-            
-            if final_confidence >= min_confidence:
-                return SignalResult(
-                    strategy_name="under_2_5_goals",
-                    signal_type="under_2_5",
-                    confidence=round(final_confidence, 3),
-                    prediction="Under 2.5 Goals",
-                    threshold_used=threshold,
-                    reasoning=f"Low attacking activity: {total_attacks} attacks, {total_shots} shots, {total_dxg:.2f} dxG",
-                    trigger_metrics={
-                        "total_attacks": total_attacks,
-                        "total_shots": total_shots,
-                        "total_dxg": total_dxg,
-                        "minute": minute
-                    },
-                    recommended_odds=self._calculate_recommended_odds("under_2_5", final_confidence),
-                    stake_multiplier=min(1.8, final_confidence + 0.3)
-                )
-        
-        return None
+        return self._analyzers["under_2_5_goals"](metrics, match_data, minute, derived)
+
+    def _under_2_5_signal(self, final_confidence: float, threshold: float,
+                          total_attacks: int, total_shots: int, total_dxg: float, minute: int) -> SignalResult:
+        stake_multiplier = final_confidence + 0.3
+        return SignalResult(
+            strategy_name="under_2_5_goals",
+            signal_type="under_2_5",
+            confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+            prediction="Under 2.5 Goals",
+            threshold_used=threshold,
+            reasoning_template="Low attacking activity: %s attacks, %s shots, %.2f dxG",
+            reasoning_args=(total_attacks, total_shots, total_dxg),
+            trigger_keys=_UNDER_2_5_GOALS_TRIGGERS,
+            trigger_values=(total_attacks, total_shots, total_dxg, minute),
+            recommended_odds=self._calculate_recommended_odds("under_2_5", final_confidence),
+            stake_multiplier=stake_multiplier if stake_multiplier < 1.8 else 1.8
+        )
     
     def analyze_momentum_shift(self, 
                              metrics: MatchMetrics, 
                              match_data: Dict[str, Any], 
-                             minute: int) -> Optional[SignalResult]:
+                             minute: int,
+                             derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
         """Analyze momentum shifts for next goal predictions"""
-        
-        config = self.config.get("momentum_shift", {})
-        threshold = config.get("threshold", 0.25)
-        stability_factor = config.get("stability_factor", 0.8)
-        
-        momentum_home = metrics.momentum_home
-        momentum_away = metrics.momentum_away
-        momentum_diff = abs(momentum_home - momentum_away)
-        
-        # Check for significant momentum shift
-        if momentum_diff > threshold and minute > 15:
-            leading_team = "home" if momentum_home > momentum_away else "away"
-            momentum_strength = max(abs(momentum_home), abs(momentum_away))
-            
-            # Calculate confidence based on momentum strength and stability
-            base_confidence = min(0.9, 0.4 + momentum_strength * 0.3)
-            stability_avg = (metrics.stability_home + metrics.stability_away) / 2
-            
-            if stability_avg < stability_factor:  # Lower stability = more volatile = higher chance of goals
-                confidence_multiplier = 1.2
-            else:
-                confidence_multiplier = 1.0
-            
-            final_confidence = base_confidence * confidence_multiplier
-            
-            # Determine signal type
-            current_score = match_data.get('home_score', 0) + match_data.get('away_score', 0)
-            
-            if momentum_strength > 0.5 and current_score == 0:
-                signal_type = "first_goal"
-                prediction = f"First goal by {leading_team} team"
-            elif momentum_strength > 0.3:
-                signal_type = "next_goal"
-                prediction = f"Next goal by {leading_team} team"
-            else:
-                return None
-            
-            if final_confidence >= 0.6:
-                return SignalResult(
-                    strategy_name="momentum_shift",
-                    signal_type=signal_type,
-                    confidence=round(final_confidence, 3),
-                    prediction=prediction,
-                    threshold_used=threshold,
-                    reasoning=f"Momentum shift: {leading_team} team leading with {momentum_strength:.2f}",
-                    trigger_metrics={
-                        "momentum_home": momentum_home,
-                        "momentum_away": momentum_away,
-                        "momentum_diff": momentum_diff,
-                        "leading_team": leading_team
-                    },
-                    recommended_odds=self._calculate_recommended_odds(signal_type, final_confidence)
-                )
-        
-        return None
+        return self._analyzers["momentum_shift"](metrics, match_data, minute, derived)
+
+    def _momentum_shift_signal(self, signal_type: str, final_confidence: float, threshold: float,
+                               momentum_home: float, momentum_away: float) -> SignalResult:
+        leading = HOME if momentum_home > momentum_away else AWAY
+        leading_team = TEAM_NAMES[leading]
+        momentum_strength = max(fabs(momentum_home), fabs(momentum_away))
+        
+        return SignalResult(
+            strategy_name="momentum_shift",
+            signal_type=signal_type,
+            confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+            prediction=_MOMENTUM_PREDICTIONS[signal_type][leading],
+            threshold_used=threshold,
+            reasoning_template="Momentum shift: %s team leading with %.2f",
+            reasoning_args=(leading_team, momentum_strength),
+            trigger_keys=_MOMENTUM_SHIFT_TRIGGERS,
+            trigger_values=(momentum_home, momentum_away, fabs(momentum_home - momentum_away), leading_team),
+            recommended_odds=self._calculate_recommended_odds(signal_type, final_confidence)
+        )
     
-    def analyze_tiredness_advantage(self, 
-                                  metrics: MatchMetrics, 
-                                  match_data: Dict[str, Any], 
-                                  minute: int) -> Optional[SignalResult]:
-        """Analyze tiredness differences for late game opportunities"""
-        
-        config = self.config.get("tiredness_advantage", {})
-        threshold = config.get("threshold", 0.3)
-        gradient_factor = config.get("gradient_factor", 0.2)
+    def analyze_next_goal_away(self, 
+                             metrics: MatchMetrics, 
+                             match_data: Dict[str, Any], 
+                             minute: int,
+                             derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+        """Analyze away team next goal prediction"""
+        return self._analyzers["next_goal_away"](metrics, match_data, minute, derived)
+
+    def _next_goal_away_signal(self, final_confidence: float, threshold: float, away_momentum: float,
+                               away_efficiency: float, momentum_diff: float, minute: int) -> SignalResult:
+        stake_multiplier = final_confidence + 0.2
+        return SignalResult(
+            strategy_name="next_goal_away",
+            signal_type="next_goal_away",
+            confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+            prediction="Next Goal: Away Team",
+            threshold_used=threshold,
+            reasoning_template="Away momentum: %.2f, efficiency: %.2f",
+            reasoning_args=(away_momentum, away_efficiency),
+            trigger_keys=_NEXT_GOAL_AWAY_TRIGGERS,
+            trigger_values=(away_momentum, away_efficiency, momentum_diff, minute),
+            recommended_odds=self._calculate_recommended_odds("next_goal_away", final_confidence),
+            stake_multiplier=stake_multiplier if stake_multiplier < 1.5 else 1.5
+        )
+
+    # Batch evaluation over MatchMetricsBatch: scorers return fired masks and
+    # SignalResult objects are built only for the rows that fired
+
+    def analyze_all_strategies_batch(self, metrics_batch: MatchMetricsBatch,
+                                     match_data_batch: List[Dict[str, Any]],
+                                     minutes: np.ndarray) -> List[List[SignalResult]]:
+        """Batch analyze_all_strategies for a live book: one signal list per match
+
+        Covers the active strategies; experimental analyzers have no
+        vectorized form and only run in analyze_all_strategies.
+        """
+        minutes = np.asarray(minutes)
+        total_scores = np.fromiter(
+            (match_data.get('home_score', 0) + match_data.get('away_score', 0) for match_data in match_data_batch),
+            dtype=np.int64, count=metrics_batch.size
+        )
+        signal_ids, confidences = self.score_batch(metrics_batch, minutes, total_scores)
+        
+        signals: List[List[SignalResult]] = [[] for _ in range(metrics_batch.size)]
+        rows, columns = np.nonzero(signal_ids)
+        
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            result = self._batch_signal(column, row, int(signal_ids[row, column]),
+                                        float(confidences[row, column]), metrics_batch, minutes)
+            if result.confidence > 0.5:  # Minimum confidence threshold
+                signals[row].append(result)
+                self.logger.info(f"Signal generated: {SCORE_ALL_COLUMNS[column]} - {result.confidence:.2f}")
         
-        if minute < 60:  # Only relevant in later stages
-            return None
+        return signals
+
+    def analyze_over_2_5_goals_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Dict[int, SignalResult]:
+        """Vectorized analyze_over_2_5_goals, keyed by batch row"""
+        fired, signal_codes, final_confidence = self._score_over_2_5_batch(batch, minutes)
+        return {
+            int(i): self._batch_signal(0, i, int(signal_codes[i]), float(final_confidence[i]), batch, minutes)
+            for i in np.flatnonzero(fired)
+        }
+
+    def analyze_under_2_5_goals_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Dict[int, SignalResult]:
+        """Vectorized analyze_under_2_5_goals, keyed by batch row"""
+        fired, final_confidence = self._score_under_2_5_batch(batch, minutes)
+        return {
+            int(i): self._batch_signal(1, i, 1, float(final_confidence[i]), batch, minutes)
+            for i in np.flatnonzero(fired)
+        }
+
+    def analyze_momentum_shift_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray,
+                                     total_scores: np.ndarray) -> Dict[int, SignalResult]:
+        """Vectorized analyze_momentum_shift, keyed by batch row"""
+        fired, first_goal, final_confidence = self._score_momentum_shift_batch(batch, minutes, total_scores)
+        return {
+            int(i): self._batch_signal(2, i, 1 if first_goal[i] else 2, float(final_confidence[i]), batch, minutes)
+            for i in np.flatnonzero(fired)
+        }
+
+    def analyze_next_goal_away_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Dict[int, SignalResult]:
+        """Vectorized analyze_next_goal_away, keyed by batch row"""
+        fired, final_confidence = self._score_next_goal_away_batch(batch, minutes)
+        return {
+            int(i): self._batch_signal(3, i, 1, float(final_confidence[i]), batch, minutes)
+            for i in np.flatnonzero(fired)
+        }
+
+    def _batch_signal(self, column: int, row: int, signal_id: int, final_confidence: float,
+                      batch: MatchMetricsBatch, minutes: np.ndarray) -> SignalResult:
+        """Build the SignalResult of strategy `column` (score_batch layout) for one batch row"""
+        minute = int(minutes[row])
+        dxg_home = float(batch.dxg_home[row])
+        dxg_away = float(batch.dxg_away[row])
+        momentum_home = float(batch.momentum_home[row])
+        momentum_away = float(batch.momentum_away[row])
+        
+        if column == 0:
+            return self._dxg_spike_signal(_DXG_SIGNAL_TYPES[signal_id], final_confidence, self._over25_threshold,
+                                          dxg_home + dxg_away, fabs(dxg_home - dxg_away), minute)
+        if column == 1:
+            return self._under_2_5_signal(final_confidence, self._under25_threshold,
+                                          int(batch.attacks_home[row]) + int(batch.attacks_away[row]),
+                                          int(batch.shots_home[row]) + int(batch.shots_away[row]),
+                                          dxg_home + dxg_away, minute)
+        if column == 2:
+            return self._momentum_shift_signal(_MOMENTUM_SIGNAL_TYPES[signal_id], final_confidence,
+                                               self._momentum_threshold, momentum_home, momentum_away)
+        return self._next_goal_away_signal(final_confidence, self._away_threshold, momentum_away,
+                                           float(batch.shots_per_attack_away[row]),
+                                           momentum_away - momentum_home, minute)
+
+    def score_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray,
+                    total_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score all active strategies for a batch of matches
+
+        Returns (signal ids, confidences) matrices of shape (matches, strategies),
+        columns follow SCORE_ALL_COLUMNS; signal id 0 means
+        the strategy didn't fire for that match.
+        """
+        out_sig = np.zeros((batch.size, 4), dtype=np.int64)
+        out_conf = np.zeros((batch.size, 4), dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            # One fused parallel kernel over all matches
+            score_all(batch.dxg_home, batch.dxg_away, batch.momentum_home, batch.momentum_away,
+                      batch.stability_home, batch.stability_away, batch.attacks_home, batch.attacks_away,
+                      batch.shots_home, batch.shots_away, batch.shots_per_attack_away,
+                      minutes, total_scores, self._score_all_params, out_sig, out_conf)
+            return out_sig, out_conf
+        
+        # Without Numba the per-strategy NumPy scorers are faster than a Python loop
+        fired, signal_codes, final_confidence = self._score_over_2_5_batch(batch, minutes)
+        out_sig[:, 0] = np.where(fired, signal_codes, 0)
+        out_conf[:, 0] = np.where(fired, final_confidence, 0.0)
+        
+        fired, final_confidence = self._score_under_2_5_batch(batch, minutes)
+        out_sig[:, 1] = fired
+        out_conf[:, 1] = np.where(fired, final_confidence, 0.0)
+        
+        fired, first_goal, final_confidence = self._score_momentum_shift_batch(batch, minutes, total_scores)
+        out_sig[:, 2] = np.where(fired, np.where(first_goal, 1, 2), 0)
+        out_conf[:, 2] = np.where(fired, final_confidence, 0.0)
+        
+        fired, final_confidence = self._score_next_goal_away_batch(batch, minutes)
+        out_sig[:, 3] = fired
+        out_conf[:, 3] = np.where(fired, final_confidence, 0.0)
+        
+        return out_sig, out_conf
+
+    def _score_over_2_5_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        threshold = self._over25_threshold
+        min_confidence = self._over25_min_confidence
+        
+        total_dxg = batch.dxg_home + batch.dxg_away
+        dxg_imbalance = np.abs(batch.dxg_home - batch.dxg_away)
+        
+        # np.select takes the first matching branch, same as the if/elif ladder
+        branches = [
+            (total_dxg > 1.5) & (minutes < 70),
+            (total_dxg > 1.0) & (minutes < 60),
+            (total_dxg > 0.8) & (dxg_imbalance > 0.3)
+        ]
+        signal_codes = np.select(branches, [1, 2, 3], 0)
+        confidence = np.select(branches, [
+            np.minimum(0.9, 0.5 + (total_dxg - 1.5) * 0.3),
+            np.minimum(0.85, 0.5 + (total_dxg - 1.0) * 0.4),
+            np.minimum(0.8, 0.5 + dxg_imbalance * 0.5)
+        ], 0.0)
+        
+        momentum_factor = (np.abs(batch.momentum_home) + np.abs(batch.momentum_away)) * 0.1
+        final_confidence = confidence * self._time_confidence_factors(minutes) * (1 + momentum_factor)
+        
+        fired = ((total_dxg > threshold) & (minutes > 20) & (signal_codes > 0)
+                 & (final_confidence >= min_confidence))
+        return fired, signal_codes, final_confidence
+
+    def _score_under_2_5_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        threshold = self._under25_threshold
+        min_confidence = self._under25_min_confidence
         
-        tiredness_diff = abs(metrics.tiredness_home - metrics.tiredness_away)
-        
-        if tiredness_diff > threshold:
-            less_tired_team = "home" if metrics.tiredness_home < metrics.tiredness_away else "away"
-            advantage_magnitude = tiredness_diff
-            
-            # Factor in gradient (team getting stronger vs weaker)
-            gradient_home = metrics.gradient_home
-            gradient_away = metrics.gradient_away
-            
-            if less_tired_team == "home" and gradient_home > gradient_factor:
-                confidence_boost = 0.2
-            elif less_tired_team == "away" and gradient_away > gradient_factor:
-                confidence_boost = 0.2
-            else:
-                confidence_boost = 0.0
-            
-            base_confidence = 0.5 + advantage_magnitude
-            final_confidence = min(0.9, base_confidence + confidence_boost)
-            
-            # Late game time boost
-            late_game_boost = (minute - 60) / 30 * 0.1
-            final_confidence += late_game_boost
-            
-            if final_confidence >= 0.65:
-                return SignalResult(
-                    strategy_name="tiredness_advantage",
-                    signal_type="late_goal",
-                    confidence=round(final_confidence, 3),
-                    prediction=f"Late goal by {less_tired_team} team",
-                    threshold_used=threshold,
-                    reasoning=f"Tiredness advantage: {less_tired_team} team less tired by {advantage_magnitude:.2f}",
-                    trigger_metrics={
-                        "tiredness_home": metrics.tiredness_home,
-                        "tiredness_away": metrics.tiredness_away,
-                        "tiredness_diff": tiredness_diff,
-                        "advantage_team": less_tired_team
-                    },
-                    recommended_odds=self._calculate_recommended_odds("late_goal", final_confidence)
-                )
-        
-        return None
-    
-    def analyze_shots_efficiency(self, 
-                               metrics: MatchMetrics, 
-                               match_data: Dict[str, Any], 
-                               minute: int) -> Optional[SignalResult]:
-        """Analyze shots per attack efficiency for scoring predictions"""
+        total_attacks = batch.attacks_home + batch.attacks_away
+        total_shots = batch.shots_home + batch.shots_away
+        total_dxg = batch.dxg_home + batch.dxg_away
         
-        if minute < 25:  # Need enough data
-            return None
+        attacking_factor = 1.0 - np.minimum(1.0, (total_attacks / 20.0 + total_shots / 15.0) / 2.0)
+        dxg_factor = 1.0 - np.minimum(1.0, total_dxg / 2.5)
+        confidence = attacking_factor * 0.6 + dxg_factor * 0.4
         
-        spa_home = metrics.shots_per_attack_home
-        spa_away = metrics.shots_per_attack_away
-        
-        # High efficiency threshold
-        high_efficiency_threshold = 0.4
-        
-        if spa_home > high_efficiency_threshold or spa_away > high_efficiency_threshold:
-            efficient_team = "home" if spa_home > spa_away else "away"
-            max_efficiency = max(spa_home, spa_away)
-            
-            # Check if team also has momentum
-            momentum_home = abs(metrics.momentum_home)
-            momentum_away = abs(metrics.momentum_away)
-            
-            if efficient_team == "home" and momentum_home > 0.2:
-                confidence = 0.6 + max_efficiency * 0.5 + momentum_home * 0.2
-            elif efficient_team == "away" and momentum_away > 0.2:
-                confidence = 0.6 + max_efficiency * 0.5 + momentum_away * 0.2
-            else:
-                confidence = 0.5 + max_efficiency * 0.3
-            
-            final_confidence = min(0.88, confidence)
-            
-            if final_confidence >= 0.6:
-                return SignalResult(
-                    strategy_name="shots_efficiency",
-                    signal_type="team_to_score",
-                    confidence=round(final_confidence, 3),
-                    prediction=f"{efficient_team.title()} team to score",
-                    threshold_used=high_efficiency_threshold,
-                    reasoning=f"High shots efficiency: {efficient_team} team {max_efficiency:.2f} shots/attack",
-                    trigger_metrics={
-                        "spa_home": spa_home,
-                        "spa_away": spa_away,
-                        "efficient_team": efficient_team,
-                        "max_efficiency": max_efficiency
-                    },
-                    recommended_odds=self._calculate_recommended_odds("team_to_score", final_confidence)
-                )
-        
-        return None
-    
-    def analyze_wave_pattern(self, 
-                           metrics: MatchMetrics, 
-                           match_data: Dict[str, Any], 
-                           minute: int) -> Optional[SignalResult]:
-        """Analyze wave patterns for intensity-based predictions"""
-        
-        wave_amplitude = metrics.wave_amplitude
-        
-        if wave_amplitude > 2.0 and minute > 20:  # High volatility match
-            # High amplitude suggests unpredictable, goal-rich match
-            total_goals = match_data.get('home_score', 0) + match_data.get('away_score', 0)
-            
-            if total_goals < 2:  # Still room for more goals
-                confidence = 0.55 + (wave_amplitude - 2.0) * 0.1
-                confidence = min(0.8, confidence)
-                
-                return SignalResult(
-                    strategy_name="wave_pattern",
-                    signal_type="over_2.5" if total_goals <= 1 else "over_3.5",
-                    confidence=round(confidence, 3),
-                    prediction="Over 2.5 goals" if total_goals <= 1 else "Over 3.5 goals",
-                    threshold_used=2.0,
-                    reasoning=f"High wave amplitude {wave_amplitude:.2f} indicates volatile match",
-                    trigger_metrics={
-                        "wave_amplitude": wave_amplitude,
-                        "current_goals": total_goals,
-                        "minute": minute
-                    },
-                    recommended_odds=self._calculate_recommended_odds("over_goals", confidence)
-                )
-        
-        return None
-    
-    def analyze_gradient_breakout(self, 
-                                metrics: MatchMetrics, 
-                                match_data: Dict[str, Any], 
-                                minute: int) -> Optional[SignalResult]:
-        """Analyze gradient breakouts for trend continuation"""
-        
-        gradient_home = metrics.gradient_home
-        gradient_away = metrics.gradient_away
-        
-        strong_gradient_threshold = 0.3
-        
-        if abs(gradient_home) > strong_gradient_threshold or abs(gradient_away) > strong_gradient_threshold:
-            if abs(gradient_home) > abs(gradient_away):
-                trending_team = "home"
-                gradient_strength = abs(gradient_home)
-                trend_direction = "up" if gradient_home > 0 else "down"
-            else:
-                trending_team = "away"
-                gradient_strength = abs(gradient_away)
-                trend_direction = "up" if gradient_away > 0 else "down"
-            
-            if trend_direction == "up":  # Positive trend
-                confidence = 0.55 + gradient_strength * 0.4
-                confidence = min(0.85, confidence)
-                
-                return SignalResult(
-                    strategy_name="gradient_breakout",
-                    signal_type="team_performance",
-                    confidence=round(confidence, 3),
-                    prediction=f"{trending_team.title()} team strong trend",
-                    threshold_used=strong_gradient_threshold,
-                    reasoning=f"Strong upward gradient {gradient_strength:.2f} for {trending_team}",
-                    trigger_metrics={
-                        "gradient_home": gradient_home,
-                        "gradient_away": gradient_away,
-                        "trending_team": trending_team,
-                        "gradient_strength": gradient_strength
-                    },
-                    recommended_odds=self._calculate_recommended_odds("team_performance", confidence)
-                )
-        
-        return None
-    
-    def analyze_stability_disruption(self, 
-                                   metrics: MatchMetrics, 
-                                   match_data: Dict[str, Any], 
-                                   minute: int) -> Optional[SignalResult]:
-        """Analyze stability disruptions for chaos-based predictions"""
-        
-        stability_home = metrics.stability_home
-        stability_away = metrics.stability_away
-        avg_stability = (stability_home + stability_away) / 2
-        
-        low_stability_threshold = 0.3
-        
-        if avg_stability < low_stability_threshold and minute > 30:
-            # Low stability = chaotic match = more goals likely
-            chaos_level = 1.0 - avg_stability
-            confidence = 0.5 + chaos_level * 0.3
-            
-            # Factor in current goal situation
-            total_goals = match_data.get('home_score', 0) + match_data.get('away_score', 0)
-            
-            if total_goals == 0:
-                signal_type = "btts"
-                prediction = "Both teams to score"
-            elif total_goals == 1:
-                signal_type = "over_2.5"
-                prediction = "Over 2.5 goals"
-            else:
-                signal_type = "over_3.5"
-                prediction = "Over 3.5 goals"
-            
-            final_confidence = min(0.8, confidence)
-            
-            if final_confidence >= 0.6:
-                return SignalResult(
-                    strategy_name="stability_disruption",
-                    signal_type=signal_type,
-                    confidence=round(final_confidence, 3),
-                    prediction=prediction,
-                    threshold_used=low_stability_threshold,
-                    reasoning=f"Low stability {avg_stability:.2f} indicates chaotic match",
-                    trigger_metrics={
-                        "stability_home": stability_home,
-                        "stability_away": stability_away,
-                        "avg_stability": avg_stability,
-                        "chaos_level": chaos_level
-                    },
-                    recommended_odds=self._calculate_recommended_odds(signal_type, final_confidence)
-                )
-        
-        return None
+        final_confidence = confidence * self._time_confidence_factors(minutes)
+        fired = (confidence >= threshold) & (final_confidence >= min_confidence)
+        return fired, final_confidence
 
-    def analyze_next_goal_away(self, 
-                             metrics: MatchMetrics, 
-                             match_data: Dict[str, Any], 
-                             minute: int) -> Optional[SignalResult]:
-        """Analyze away team next goal prediction"""
+    def _score_momentum_shift_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray,
+                                    total_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        threshold = self._momentum_threshold
+        stability_factor = self._momentum_stability_factor
+        
+        momentum_diff = np.abs(batch.momentum_home - batch.momentum_away)
+        momentum_strength = np.maximum(np.abs(batch.momentum_home), np.abs(batch.momentum_away))
+        
+        base_confidence = np.minimum(0.9, 0.4 + momentum_strength * 0.3)
+        stability_avg = (batch.stability_home + batch.stability_away) / 2
+        final_confidence = base_confidence * np.where(stability_avg < stability_factor, 1.2, 1.0)
+        
+        first_goal = (momentum_strength > 0.5) & (total_scores == 0)
+        fired = ((momentum_diff > threshold) & (minutes > 15)
+                 & (first_goal | (momentum_strength > 0.3)) & (final_confidence >= 0.6))
+        return fired, first_goal, final_confidence
+
+    def _score_next_goal_away_batch(self, batch: MatchMetricsBatch, minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        threshold = self._away_threshold
+        min_confidence = self._away_min_confidence
+        
+        momentum_diff = batch.momentum_away - batch.momentum_home
         
-        config = self.config.get("next_goal_away", {})
-        threshold = config.get("threshold", 0.7)
-        min_confidence = config.get("min_confidence", 0.65)
-        
-        # Analyze away team momentum and attacking metrics
-        away_momentum = metrics.momentum_away
-        away_efficiency = metrics.shots_per_attack_away
-        momentum_diff = metrics.momentum_away - metrics.momentum_home
-        
-        confidence = 0.0
-        
-        # Strong away momentum suggests next goal
-        if away_momentum > 0.3 and momentum_diff > 0.15:
-            confidence += 0.4
-        
-        # High away efficiency
-        if away_efficiency > 0.3:
-            confidence += 0.3
-        
-        # Away pressure indicators
-        if metrics.attacks_away > metrics.attacks_home * 1.2:
-            confidence += 0.2
-            
-        if metrics.shots_away > metrics.shots_home:
-            confidence += 0.1
-        
-        if confidence >= threshold:
-            time_factor = self._get_time_confidence_factor(minute)
-            final_confidence = confidence * time_factor
-            
-            if final_confidence >= min_confidence:
-                return SignalResult(
-                    strategy_name="next_goal_away",
-                    signal_type="next_goal_away",
-                    confidence=round(final_confidence, 3),
-                    prediction="Next Goal: Away Team",
-                    threshold_used=threshold,
-                    reasoning=f"Away momentum: {away_momentum:.2f}, efficiency: {away_efficiency:.2f}",
-                    trigger_metrics={
-                        "away_momentum": away_momentum,
-                        "away_efficiency": away_efficiency,
-                        "momentum_diff": momentum_diff,
-                        "minute": minute
-                    },
-                    recommended_odds=self._calculate_recommended_odds("next_goal_away", final_confidence),
-                    stake_multiplier=min(1.5, final_confidence + 0.2)
-                )
-        
-        return None
+        # Same accumulation order as the scalar path to keep results identical
+        confidence = np.where((batch.momentum_away > 0.3) & (momentum_diff > 0.15), 0.4, 0.0)
+        confidence += np.where(batch.shots_per_attack_away > 0.3, 0.3, 0.0)
+        confidence += np.where(batch.attacks_away > batch.attacks_home * 1.2, 0.2, 0.0)
+        confidence += np.where(batch.shots_away > batch.shots_home, 0.1, 0.0)
+        
+        final_confidence = confidence * self._time_confidence_factors(minutes)
+        fired = (confidence >= threshold) & (final_confidence >= min_confidence)
+        return fired, final_confidence
     
     def _get_time_confidence_factor(self, minute: int) -> float:
         """Get time-based confidence factor"""
-        if minute < 20:
-            return 0.7  # Lower confidence early
-        elif minute < 45:
-            return 1.0  # Peak confidence
-        elif minute < 70:
-            return 0.9  # Slightly lower
-        else:
-            return 1.1  # Higher in late game
+        index = int(minute)
+        return float(TIME_FACTOR_LUT[0 if index < 0 else (index if index < 120 else 120)])
+
+    def _time_confidence_factors(self, minutes: np.ndarray) -> np.ndarray:
+        """Vectorized _get_time_confidence_factor: one gather over the LUT"""
+        return TIME_FACTOR_LUT.take(np.clip(minutes, 0, 120).astype(np.intp))
     
-    def _calculate_recommended_odds(self, signal_type: str, confidence: float) -> float:
+    @staticmethod
+    def _calculate_recommended_odds(signal_type: str, confidence: float) -> float:
         """Calculate recommended minimum odds based on confidence"""
-        # Convert confidence to implied probability and add margin
-        implied_prob = confidence
-        fair_odds = 1.0 / implied_prob
-        
-        # Add safety margin (10-20%)
-        margin = 0.15 if confidence > 0.8 else 0.1
-        recommended_odds = fair_odds * (1 + margin)
-        
-        return round(recommended_odds, 2)
+        return _recommended_odds(int(confidence * 1000.0 + 0.5) / 1000.0, confidence > 0.8)
     
     def update_strategy_config(self, strategy_name: str, new_config: Dict[str, Any]):
         """Update configuration for a specific strategy"""
         if strategy_name in self.config:
             self.config[strategy_name].update(new_config)
+            self._refresh_cached_thresholds()
             self.logger.info(f"Updated config for {strategy_name}: {new_config}")
         else:
             self.logger.warning(f"Strategy {strategy_name} not found in config")
+
+    def _refresh_cached_thresholds(self):
+        """Copy the active strategies' thresholds out of the config dict
+
+        The analyzers read these attributes instead of two nested dict
+        lookups per call; must be re-run whenever self.config changes.
+        """
+        over = self.config.get("dxg_spike", {})
+        under = self.config.get("under_2_5_goals", {})
+        momentum = self.config.get("momentum_shift", {})
+        away = self.config.get("next_goal_away", {})
+        
+        self._over25_threshold = over.get("threshold", 0.15)
+        self._over25_min_confidence = over.get("min_confidence", 0.7)
+        self._under25_threshold = under.get("threshold", 0.6)
+        self._under25_min_confidence = under.get("min_confidence", 0.65)
+        self._momentum_threshold = momentum.get("threshold", 0.25)
+        self._momentum_stability_factor = momentum.get("stability_factor", 0.8)
+        self._away_threshold = away.get("threshold", 0.7)
+        self._away_min_confidence = away.get("min_confidence", 0.65)
+        
+        # Same values in the layout expected by strategies_kernels.score_all
+        self._score_all_params = np.array([
+            self._over25_threshold, self._over25_min_confidence,
+            self._under25_threshold, self._under25_min_confidence,
+            self._momentum_threshold, self._momentum_stability_factor,
+            self._away_threshold, self._away_min_confidence
+        ], dtype=np.float64)
+        
+        self._specialize_analyzers()
+
+    def _specialize_analyzers(self):
+        """Rebuild the active analyzers with the cached thresholds bound in
+
+        The public analyze_* methods and the hot-path dispatch both go
+        through these closures, so the per-call threshold lookups are gone.
+        """
+        self._analyzers = {
+            "over_2_5_goals": _make_over_2_5_goals(
+                self._dxg_spike_signal, self._over25_threshold, self._over25_min_confidence),
+            "under_2_5_goals": _make_under_2_5_goals(
+                self._under_2_5_signal, self._under25_threshold, self._under25_min_confidence),
+            "momentum_shift": _make_momentum_shift(
+                self._momentum_shift_signal, self._momentum_threshold, self._momentum_stability_factor),
+            "next_goal_away": _make_next_goal_away(
+                self._next_goal_away_signal, self._away_threshold, self._away_min_confidence)
+        }
+        
+        # Hot-path dispatch order: a tuple of (name, analyzer) pairs
+        self._strategy_list = tuple(
+            (name, self._analyzers.get(name, func)) for name, func in self.strategies.items()
+        )
+        self._build_minute_buckets()
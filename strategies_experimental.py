@@ -0,0 +1,263 @@
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from math import fabs
+from metrics_calculator import MatchMetrics
+from strategies import SignalResult, DerivedMetrics, HOME, AWAY, TEAM_NAMES
+
+if TYPE_CHECKING:
+    from strategies import BettingStrategies
+
+# Analyzers that are not part of the default dispatch. BettingStrategies binds
+# them as methods when the "enabled_experimental" config option lists them.
+
+_TIREDNESS_ADVANTAGE_TRIGGERS = ("tiredness_home", "tiredness_away", "tiredness_diff", "advantage_team")
+_SHOTS_EFFICIENCY_TRIGGERS = ("spa_home", "spa_away", "efficient_team", "max_efficiency")
+_WAVE_PATTERN_TRIGGERS = ("wave_amplitude", "current_goals", "minute")
+_GRADIENT_BREAKOUT_TRIGGERS = ("gradient_home", "gradient_away", "trending_team", "gradient_strength")
+_STABILITY_DISRUPTION_TRIGGERS = ("stability_home", "stability_away", "avg_stability", "chaos_level")
+
+# Predictions per team side, indexed by HOME / AWAY
+_LATE_GOAL_PREDICTIONS = ("Late goal by home team", "Late goal by away team")
+_TEAM_TO_SCORE_PREDICTIONS = ("Home team to score", "Away team to score")
+_STRONG_TREND_PREDICTIONS = ("Home team strong trend", "Away team strong trend")
+
+
+def analyze_tiredness_advantage(strategies: "BettingStrategies",
+                                metrics: MatchMetrics,
+                                match_data: Dict[str, Any],
+                                minute: int,
+                                derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+    """Analyze tiredness differences for late game opportunities"""
+
+    config = strategies.config.get("tiredness_advantage", {})
+    threshold = config.get("threshold", 0.3)
+    gradient_factor = config.get("gradient_factor", 0.2)
+
+    if minute < 60:  # Only relevant in later stages
+        return None
+
+    tiredness_diff = fabs(metrics.tiredness_home - metrics.tiredness_away)
+
+    if tiredness_diff > threshold:
+        less_tired = HOME if metrics.tiredness_home < metrics.tiredness_away else AWAY
+        advantage_magnitude = tiredness_diff
+
+        # Factor in gradient (team getting stronger vs weaker)
+        gradient_home = metrics.gradient_home
+        gradient_away = metrics.gradient_away
+
+        if less_tired == HOME and gradient_home > gradient_factor:
+            confidence_boost = 0.2
+        elif less_tired == AWAY and gradient_away > gradient_factor:
+            confidence_boost = 0.2
+        else:
+            confidence_boost = 0.0
+
+        base_confidence = 0.5 + advantage_magnitude
+        final_confidence = min(0.9, base_confidence + confidence_boost)
+
+        # Late game time boost
+        late_game_boost = (minute - 60) / 30 * 0.1
+        final_confidence += late_game_boost
+
+        if final_confidence >= 0.65:
+            less_tired_team = TEAM_NAMES[less_tired]
+            return SignalResult(
+                strategy_name="tiredness_advantage",
+                signal_type="late_goal",
+                confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+                prediction=_LATE_GOAL_PREDICTIONS[less_tired],
+                threshold_used=threshold,
+                reasoning_template="Tiredness advantage: %s team less tired by %.2f",
+                reasoning_args=(less_tired_team, advantage_magnitude),
+                trigger_keys=_TIREDNESS_ADVANTAGE_TRIGGERS,
+                trigger_values=(metrics.tiredness_home, metrics.tiredness_away, tiredness_diff, less_tired_team),
+                recommended_odds=strategies._calculate_recommended_odds("late_goal", final_confidence)
+            )
+
+    return None
+
+
+def analyze_shots_efficiency(strategies: "BettingStrategies",
+                             metrics: MatchMetrics,
+                             match_data: Dict[str, Any],
+                             minute: int,
+                             derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+    """Analyze shots per attack efficiency for scoring predictions"""
+
+    if minute < 25:  # Need enough data
+        return None
+
+    spa_home = metrics.shots_per_attack_home
+    spa_away = metrics.shots_per_attack_away
+
+    # High efficiency threshold
+    high_efficiency_threshold = 0.4
+
+    if spa_home > high_efficiency_threshold or spa_away > high_efficiency_threshold:
+        efficient = HOME if spa_home > spa_away else AWAY
+        max_efficiency = max(spa_home, spa_away)
+
+        # Check if team also has momentum
+        momentum_home = fabs(metrics.momentum_home)
+        momentum_away = fabs(metrics.momentum_away)
+
+        if efficient == HOME and momentum_home > 0.2:
+            confidence = 0.6 + max_efficiency * 0.5 + momentum_home * 0.2
+        elif efficient == AWAY and momentum_away > 0.2:
+            confidence = 0.6 + max_efficiency * 0.5 + momentum_away * 0.2
+        else:
+            confidence = 0.5 + max_efficiency * 0.3
+
+        final_confidence = min(0.88, confidence)
+
+        if final_confidence >= 0.6:
+            efficient_team = TEAM_NAMES[efficient]
+            return SignalResult(
+                strategy_name="shots_efficiency",
+                signal_type="team_to_score",
+                confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+                prediction=_TEAM_TO_SCORE_PREDICTIONS[efficient],
+                threshold_used=high_efficiency_threshold,
+                reasoning_template="High shots efficiency: %s team %.2f shots/attack",
+                reasoning_args=(efficient_team, max_efficiency),
+                trigger_keys=_SHOTS_EFFICIENCY_TRIGGERS,
+                trigger_values=(spa_home, spa_away, efficient_team, max_efficiency),
+                recommended_odds=strategies._calculate_recommended_odds("team_to_score", final_confidence)
+            )
+
+    return None
+
+
+def analyze_wave_pattern(strategies: "BettingStrategies",
+                         metrics: MatchMetrics,
+                         match_data: Dict[str, Any],
+                         minute: int,
+                         derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+    """Analyze wave patterns for intensity-based predictions"""
+
+    wave_amplitude = metrics.wave_amplitude
+
+    if wave_amplitude > 2.0 and minute > 20:  # High volatility match
+        # High amplitude suggests unpredictable, goal-rich match
+        total_goals = derived.total_score if derived else match_data.get('home_score', 0) + match_data.get('away_score', 0)
+
+        if total_goals < 2:  # Still room for more goals
+            confidence = 0.55 + (wave_amplitude - 2.0) * 0.1
+            confidence = min(0.8, confidence)
+
+            return SignalResult(
+                strategy_name="wave_pattern",
+                signal_type="over_2.5" if total_goals <= 1 else "over_3.5",
+                confidence=int(confidence * 1000.0 + 0.5) / 1000.0,
+                prediction="Over 2.5 goals" if total_goals <= 1 else "Over 3.5 goals",
+                threshold_used=2.0,
+                reasoning_template="High wave amplitude %.2f indicates volatile match",
+                reasoning_args=(wave_amplitude,),
+                trigger_keys=_WAVE_PATTERN_TRIGGERS,
+                trigger_values=(wave_amplitude, total_goals, minute),
+                recommended_odds=strategies._calculate_recommended_odds("over_goals", confidence)
+            )
+
+    return None
+
+
+def analyze_gradient_breakout(strategies: "BettingStrategies",
+                              metrics: MatchMetrics,
+                              match_data: Dict[str, Any],
+                              minute: int,
+                              derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+    """Analyze gradient breakouts for trend continuation"""
+
+    gradient_home = metrics.gradient_home
+    gradient_away = metrics.gradient_away
+
+    strong_gradient_threshold = 0.3
+
+    if fabs(gradient_home) > strong_gradient_threshold or fabs(gradient_away) > strong_gradient_threshold:
+        if fabs(gradient_home) > fabs(gradient_away):
+            trending = HOME
+            gradient_strength = fabs(gradient_home)
+            trending_up = gradient_home > 0
+        else:
+            trending = AWAY
+            gradient_strength = fabs(gradient_away)
+            trending_up = gradient_away > 0
+
+        if trending_up:  # Positive trend
+            confidence = 0.55 + gradient_strength * 0.4
+            confidence = min(0.85, confidence)
+            trending_team = TEAM_NAMES[trending]
+
+            return SignalResult(
+                strategy_name="gradient_breakout",
+                signal_type="team_performance",
+                confidence=int(confidence * 1000.0 + 0.5) / 1000.0,
+                prediction=_STRONG_TREND_PREDICTIONS[trending],
+                threshold_used=strong_gradient_threshold,
+                reasoning_template="Strong upward gradient %.2f for %s",
+                reasoning_args=(gradient_strength, trending_team),
+                trigger_keys=_GRADIENT_BREAKOUT_TRIGGERS,
+                trigger_values=(gradient_home, gradient_away, trending_team, gradient_strength),
+                recommended_odds=strategies._calculate_recommended_odds("team_performance", confidence)
+            )
+
+    return None
+
+
+def analyze_stability_disruption(strategies: "BettingStrategies",
+                                 metrics: MatchMetrics,
+                                 match_data: Dict[str, Any],
+                                 minute: int,
+                                 derived: Optional[DerivedMetrics] = None) -> Optional[SignalResult]:
+    """Analyze stability disruptions for chaos-based predictions"""
+
+    stability_home = metrics.stability_home
+    stability_away = metrics.stability_away
+    avg_stability = (stability_home + stability_away) / 2
+
+    low_stability_threshold = 0.3
+
+    if avg_stability < low_stability_threshold and minute > 30:
+        # Low stability = chaotic match = more goals likely
+        chaos_level = 1.0 - avg_stability
+        confidence = 0.5 + chaos_level * 0.3
+
+        # Factor in current goal situation
+        total_goals = derived.total_score if derived else match_data.get('home_score', 0) + match_data.get('away_score', 0)
+
+        if total_goals == 0:
+            signal_type = "btts"
+            prediction = "Both teams to score"
+        elif total_goals == 1:
+            signal_type = "over_2.5"
+            prediction = "Over 2.5 goals"
+        else:
+            signal_type = "over_3.5"
+            prediction = "Over 3.5 goals"
+
+        final_confidence = min(0.8, confidence)
+
+        if final_confidence >= 0.6:
+            return SignalResult(
+                strategy_name="stability_disruption",
+                signal_type=signal_type,
+                confidence=int(final_confidence * 1000.0 + 0.5) / 1000.0,
+                prediction=prediction,
+                threshold_used=low_stability_threshold,
+                reasoning_template="Low stability %.2f indicates chaotic match",
+                reasoning_args=(avg_stability,),
+                trigger_keys=_STABILITY_DISRUPTION_TRIGGERS,
+                trigger_values=(stability_home, stability_away, avg_stability, chaos_level),
+                recommended_odds=strategies._calculate_recommended_odds(signal_type, final_confidence)
+            )
+
+    return None
+
+
+EXPERIMENTAL_STRATEGIES = {
+    "tiredness_advantage": analyze_tiredness_advantage,
+    "shots_efficiency": analyze_shots_efficiency,
+    "wave_pattern": analyze_wave_pattern,
+    "gradient_breakout": analyze_gradient_breakout,
+    "stability_disruption": analyze_stability_disruption
+}
@@ -0,0 +1,194 @@
+from math import fabs
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+
+    def _fastjit(signature=None, **options):
+        """njit with the kernels' defaults: compiled once and cached on disk
+
+        fastmath stays off: FMA contraction and reciprocal division shift
+        confidences by a few ulps, enough to flip threshold comparisons
+        against the plain-Python and NumPy paths.
+        """
+        options.setdefault("cache", True)
+        if callable(signature):
+            return njit(**options)(signature)
+        return njit(signature, **options) if signature else njit(**options)
+except ImportError:  # Numba is optional: without it the kernels run as plain Python
+    def _fastjit(signature=None, **options):
+        if callable(signature):
+            return signature
+        return lambda func: func
+
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Kernels return (signal_id, final_confidence); signal_id 0 means no signal.
+# They mirror the branches of the BettingStrategies.analyze_* methods and
+# leave SignalResult construction to Python, which only happens on fire.
+# Clamps are written as inline conditionals rather than min()/max(): cheaper
+# when running as plain Python and a branchless minsd/maxsd once compiled.
+
+_SCORE_SIGNATURE = "Tuple((int64, float64))"
+
+# Time-based confidence factor per match minute (0..120): lower confidence
+# early, peak before the break, slightly lower after it, higher late game
+TIME_FACTOR_LUT = np.array([0.7] * 20 + [1.0] * 25 + [0.9] * 25 + [1.1] * 51, dtype=np.float64)
+
+
+@_fastjit
+def time_confidence_factor(minute):
+    """Time-based confidence factor looked up in TIME_FACTOR_LUT"""
+    index = int(minute)
+    return TIME_FACTOR_LUT[0 if index < 0 else (index if index < 120 else 120)]
+
+
+@_fastjit(_SCORE_SIGNATURE + "(float64, float64, float64, float64, float64, float64)")
+def score_over_2_5(total_dxg, dxg_imbalance, abs_momentum_sum, minute, threshold, min_confidence):
+    """dxG spike: 1=over_2.5, 2=over_1.5, 3=btts"""
+    if not (total_dxg > threshold and minute > 20):
+        return 0, 0.0
+
+    if total_dxg > 1.5 and minute < 70:
+        signal_id = 1
+        confidence = 0.5 + (total_dxg - 1.5) * 0.3
+        confidence = confidence if confidence < 0.9 else 0.9
+    elif total_dxg > 1.0 and minute < 60:
+        signal_id = 2
+        confidence = 0.5 + (total_dxg - 1.0) * 0.4
+        confidence = confidence if confidence < 0.85 else 0.85
+    elif total_dxg > 0.8 and dxg_imbalance > 0.3:
+        signal_id = 3
+        confidence = 0.5 + dxg_imbalance * 0.5
+        confidence = confidence if confidence < 0.8 else 0.8
+    else:
+        return 0, 0.0
+
+    momentum_factor = abs_momentum_sum * 0.1
+    final_confidence = confidence * time_confidence_factor(minute) * (1 + momentum_factor)
+
+    if final_confidence >= min_confidence:
+        return signal_id, final_confidence
+    return 0, 0.0
+
+
+@_fastjit(_SCORE_SIGNATURE + "(float64, float64, float64, float64, float64, float64)")
+def score_under_2_5(total_attacks, total_shots, total_dxg, minute, threshold, min_confidence):
+    """Under 2.5 goals: 1=under_2_5"""
+    activity = (total_attacks / 20.0 + total_shots / 15.0) / 2.0
+    dxg_level = total_dxg / 2.5
+    attacking_factor = 1.0 - (activity if activity < 1.0 else 1.0)
+    dxg_factor = 1.0 - (dxg_level if dxg_level < 1.0 else 1.0)
+    confidence = attacking_factor * 0.6 + dxg_factor * 0.4
+
+    if confidence >= threshold:
+        final_confidence = confidence * time_confidence_factor(minute)
+        if final_confidence >= min_confidence:
+            return 1, final_confidence
+    return 0, 0.0
+
+
+@_fastjit(_SCORE_SIGNATURE + "(float64, float64, float64, float64, float64, float64, float64, float64, float64)")
+def score_momentum_shift(momentum_home, momentum_away, momentum_diff, stability_home, stability_away,
+                         minute, current_score, threshold, stability_factor):
+    """Momentum shift: 1=first_goal, 2=next_goal; momentum_diff is away minus home"""
+    if not (fabs(momentum_diff) > threshold and minute > 15):
+        return 0, 0.0
+
+    strength_home = fabs(momentum_home)
+    strength_away = fabs(momentum_away)
+    momentum_strength = strength_away if strength_away > strength_home else strength_home
+    base_confidence = 0.4 + momentum_strength * 0.3
+    base_confidence = base_confidence if base_confidence < 0.9 else 0.9
+    stability_avg = (stability_home + stability_away) / 2
+
+    # Lower stability = more volatile = higher chance of goals
+    if stability_avg < stability_factor:
+        final_confidence = base_confidence * 1.2
+    else:
+        final_confidence = base_confidence * 1.0
+
+    if momentum_strength > 0.5 and current_score == 0:
+        signal_id = 1
+    elif momentum_strength > 0.3:
+        signal_id = 2
+    else:
+        return 0, 0.0
+
+    if final_confidence >= 0.6:
+        return signal_id, final_confidence
+    return 0, 0.0
+
+
+@_fastjit(_SCORE_SIGNATURE + "(float64, float64, float64, float64, float64, float64, float64, float64, float64, float64)")
+def score_next_goal_away(momentum_away, momentum_diff, spa_away, attacks_home, attacks_away,
+                         shots_home, shots_away, minute, threshold, min_confidence):
+    """Next goal by the away team: 1=next_goal_away; momentum_diff is away minus home"""
+    confidence = 0.0
+
+    if momentum_away > 0.3 and momentum_diff > 0.15:
+        confidence += 0.4
+    if spa_away > 0.3:
+        confidence += 0.3
+    if attacks_away > attacks_home * 1.2:
+        confidence += 0.2
+    if shots_away > shots_home:
+        confidence += 0.1
+
+    if confidence >= threshold:
+        final_confidence = confidence * time_confidence_factor(minute)
+        if final_confidence >= min_confidence:
+            return 1, final_confidence
+    return 0, 0.0
+
+
+@_fastjit("float64(float64, boolean)")
+def recommended_odds(confidence, high_confidence):
+    """Recommended minimum odds: fair odds of the confidence plus a 10-15% safety margin"""
+    margin = 0.15 if high_confidence else 0.1
+    return round((1.0 / confidence) * (1 + margin), 2)
+
+
+# Column order of score_all outputs and layout of its `params` vector
+SCORE_ALL_COLUMNS = ("over_2_5_goals", "under_2_5_goals", "momentum_shift", "next_goal_away")
+(P_OVER_THRESHOLD, P_OVER_MIN_CONFIDENCE,
+ P_UNDER_THRESHOLD, P_UNDER_MIN_CONFIDENCE,
+ P_MOMENTUM_THRESHOLD, P_MOMENTUM_STABILITY_FACTOR,
+ P_AWAY_THRESHOLD, P_AWAY_MIN_CONFIDENCE) = range(8)
+
+
+@_fastjit(parallel=True)
+def score_all(dxg_home, dxg_away, momentum_home, momentum_away, stability_home, stability_away,
+              attacks_home, attacks_away, shots_home, shots_away, spa_away,
+              minutes, total_scores, params, out_sig, out_conf):
+    """Score every active strategy for every match of a batch in one pass
+
+    Writes the signal id and confidence of strategy k for match i into
+    out_sig[i, k] / out_conf[i, k]; matches are processed in parallel.
+    Aggregates shared by several strategies are computed once per match.
+    """
+    for i in prange(minutes.shape[0]):
+        minute = minutes[i]
+        total_dxg = dxg_home[i] + dxg_away[i]
+        momentum_diff = momentum_away[i] - momentum_home[i]
+
+        out_sig[i, 0], out_conf[i, 0] = score_over_2_5(
+            total_dxg, fabs(dxg_home[i] - dxg_away[i]), fabs(momentum_home[i]) + fabs(momentum_away[i]),
+            minute, params[P_OVER_THRESHOLD], params[P_OVER_MIN_CONFIDENCE]
+        )
+        out_sig[i, 1], out_conf[i, 1] = score_under_2_5(
+            attacks_home[i] + attacks_away[i], shots_home[i] + shots_away[i], total_dxg,
+            minute, params[P_UNDER_THRESHOLD], params[P_UNDER_MIN_CONFIDENCE]
+        )
+        out_sig[i, 2], out_conf[i, 2] = score_momentum_shift(
+            momentum_home[i], momentum_away[i], momentum_diff, stability_home[i], stability_away[i],
+            minute, total_scores[i], params[P_MOMENTUM_THRESHOLD], params[P_MOMENTUM_STABILITY_FACTOR]
+        )
+        out_sig[i, 3], out_conf[i, 3] = score_next_goal_away(
+            momentum_away[i], momentum_diff, spa_away[i], attacks_home[i], attacks_away[i],
+            shots_home[i], shots_away[i], minute,
+            params[P_AWAY_THRESHOLD], params[P_AWAY_MIN_CONFIDENCE]
+        )
@@ -3,12 +3,109 @@
 """
 import json
 import asyncio
+import time
+from collections import defaultdict
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import asyncpg
+import numpy as np
 from config import Config
 from logger import BetBogLogger
 
+try:
+    import orjson
+except ImportError:  # orjson опционален: без него используется стандартный json
+    orjson = None
+
+# Запросы держим константами: asyncpg кэширует подготовленные выражения
+# на каждом подключении пула по тексту запроса
+
+# Итоги сигналов по стратегиям: всего, победы и победы по уровням confidence
+SIGNAL_STATS_SQL = """
+SELECT strategy_name,
+       COUNT(*) AS total,
+       COUNT(*) FILTER (WHERE result = 'win') AS wins,
+       COUNT(*) FILTER (WHERE confidence >= 0.8) AS high_total,
+       COUNT(*) FILTER (WHERE confidence >= 0.8 AND result = 'win') AS high_wins,
+       COUNT(*) FILTER (WHERE confidence < 0.6) AS low_total,
+       COUNT(*) FILTER (WHERE confidence < 0.6 AND result = 'win') AS low_wins
+FROM signals
+WHERE strategy_name = ANY($1::text[])
+AND created_at >= $2
+AND result IS NOT NULL
+GROUP BY strategy_name
+"""
+
+# Сигналы с триггерными метриками для анализа паттернов
+SIGNAL_TRIGGERS_SQL = """
+SELECT strategy_name, result, trigger_metrics
+FROM signals
+WHERE strategy_name = ANY($1::text[])
+AND created_at >= $2
+AND result IS NOT NULL
+AND trigger_metrics IS NOT NULL
+"""
+
+SELECT_CONFIGS_SQL = """
+SELECT strategy_name, config
+FROM strategy_configs
+WHERE strategy_name = ANY($1::text[])
+FOR UPDATE
+"""
+
+UPDATE_CONFIG_SQL = """UPDATE strategy_configs 
+   SET config = $1, last_optimized = $2 
+   WHERE strategy_name = $3"""
+
+# Маппинг метрик стратегий на ключи их конфигурации
+_METRIC_CONFIG_KEYS = {
+    "over_2_5_goals": {
+        "dxg_combined": "min_dxg_combined",
+        "attacks_total": "min_attacks_total",
+        "shots_total": "min_shots_total"
+    },
+    "under_2_5_goals": {
+        "dxg_combined": "max_dxg_combined",
+        "stability_both": "min_stability_both",
+        "shots_per_attack": "max_shots_per_attack"
+    },
+    "btts_yes": {
+        "dxg_both_teams": "min_dxg_both_teams",
+        "shots_both": "min_shots_both",
+        "momentum_both": "min_momentum_both"
+    },
+    "btts_no": {
+        "dxg_weaker": "max_dxg_weaker",
+        "stability_stronger": "min_stability_stronger",
+        "away_shots": "max_away_shots"
+    },
+    "home_win": {
+        "dxg_advantage": "min_dxg_advantage",
+        "home_momentum": "min_home_momentum",
+        "shots_ratio": "min_home_shots_ratio"
+    },
+    "away_win": {
+        "dxg_advantage": "min_dxg_advantage",
+        "away_momentum": "min_away_momentum",
+        "dangerous_attacks": "min_away_dangerous_attacks"
+    },
+    "draw": {
+        "dxg_difference": "max_dxg_difference",
+        "stability_both": "min_stability_both",
+        "momentum_range": "balanced_momentum_range"
+    },
+    "next_goal_home": {
+        "home_momentum": "min_home_momentum",
+        "recent_attacks": "recent_attacks_home",
+        "away_stability": "low_away_stability"
+    },
+    "next_goal_away": {
+        "away_momentum": "min_away_momentum",
+        "recent_attacks": "recent_attacks_away",
+        "home_stability": "low_home_stability"
+    }
+}
+
 class StrategyOptimizer:
     """Оптимизатор стратегий с индивидуальной адаптацией"""
     
@@ -16,6 +113,14 @@ class StrategyOptimizer:
         self.config = config
         self.logger = BetBogLogger("STRATEGY_OPTIMIZER")
         
+        # Общий пул подключений, создается при первом обращении к БД
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+        
+        # Кэш результатов анализа: strategy_name -> (time.monotonic(), анализ)
+        self._analysis_cache: Dict[str, tuple] = {}
+        self.analysis_cache_ttl = 60
+        
         # Параметры адаптации для каждой стратегии
         self.adaptation_rules = {
             "over_2_5_goals": {
@@ -74,83 +179,120 @@ class StrategyOptimizer:
             }
         }
     
-    async def get_db_connection(self):
-        """Получение подключения к базе данных"""
-        try:
-            return await asyncpg.connect(self.config.DATABASE_URL)
-        except Exception as e:
-            self.logger.error(f"Ошибка подключения к БД: {e}")
-            return None
+    async def _ensure_pool(self) -> Optional[asyncpg.Pool]:
+        """Получение общего пула подключений к базе данных"""
+        if self._pool is not None:
+            return self._pool
+        
+        async with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = await asyncpg.create_pool(
+                        self.config.DATABASE_URL,
+                        min_size=4,
+                        max_size=10,
+                        command_timeout=30,
+                        statement_cache_size=100,
+                        max_inactive_connection_lifetime=300
+                    )
+                except Exception as e:
+                    self.logger.error(f"Ошибка подключения к БД: {e}")
+        return self._pool
+    
+    async def close(self):
+        """Закрытие пула подключений"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
     
     async def analyze_strategy_performance(self, strategy_name: str) -> Dict[str, Any]:
         """Анализ результативности стратегии"""
-        conn = await self.get_db_connection()
-        if not conn:
-            return {}
+        cached = self._analysis_cache.get(strategy_name)
+        if cached and time.monotonic() - cached[0] < self.analysis_cache_ttl:
+            return cached[1]
         
         try:
             # Получаем результаты за последние 30 дней
-            query = """
-            SELECT result, confidence, trigger_metrics, created_at
-            FROM signals 
-            WHERE strategy_name = $1 
-            AND created_at >= $2 
-            AND result IS NOT NULL
-            ORDER BY created_at DESC
-            """
-            
             since_date = datetime.now() - timedelta(days=30)
-            results = await conn.fetch(query, strategy_name, since_date)
-            
-            if len(results) < self.adaptation_rules[strategy_name]["min_samples"]:
-                return {"status": "insufficient_data", "samples": len(results)}
-            
-            # Анализируем результаты
-            wins = sum(1 for r in results if r['result'] == 'win')
-            total = len(results)
-            current_accuracy = wins / total if total > 0 else 0
+            fetched = await self._fetch_all_signals(since_date, [strategy_name])
+            if fetched is None:
+                return {}
             
-            # Анализируем конфиденция vs результат
-            confidence_analysis = self._analyze_confidence_correlation(results)
-            
-            # Анализируем триггерные метрики
-            metrics_analysis = self._analyze_trigger_metrics(results, strategy_name)
-            
-            return {
-                "status": "sufficient_data",
-                "total_signals": total,
-                "wins": wins,
-                "current_accuracy": current_accuracy,
-                "target_accuracy": self.adaptation_rules[strategy_name]["target_accuracy"],
-                "confidence_analysis": confidence_analysis,
-                "metrics_analysis": metrics_analysis,
-                "needs_adjustment": abs(current_accuracy - self.adaptation_rules[strategy_name]["target_accuracy"]) > 0.05
-            }
+            stats_by_strategy, signals_by_strategy = fetched
+            return self._analyze_from_rows(
+                strategy_name, stats_by_strategy.get(strategy_name), signals_by_strategy[strategy_name]
+            )
             
         except Exception as e:
             self.logger.error(f"Ошибка анализа стратегии {strategy_name}: {e}")
             return {}
-        finally:
-            await conn.close()
     
-    def _analyze_confidence_correlation(self, results: List[Dict]) -> Dict[str, Any]:
-        """Анализ корреляции между confidence и результатом"""
-        if not results:
-            return {}
+    async def _fetch_all_signals(self, since_date: datetime, strategy_names: Optional[List[str]] = None):
+        """Статистика и триггерные метрики сигналов, сгруппированные по стратегии
         
-        high_conf_results = [r for r in results if r.get('confidence', 0) >= 0.8]
-        low_conf_results = [r for r in results if r.get('confidence', 0) < 0.6]
+        Подсчет побед и точности по уровням confidence выполняется в БД,
+        построчно загружаются только сигналы с trigger_metrics.
+        Возвращает (статистика по стратегиям, сигналы по стратегиям) или None.
+        """
+        pool = await self._ensure_pool()
+        if not pool:
+            return None
+        
+        if strategy_names is None:
+            strategy_names = list(self.adaptation_rules.keys())
+        
+        async with pool.acquire() as conn:
+            stats_rows = await conn.fetch(SIGNAL_STATS_SQL, strategy_names, since_date)
+            rows = await conn.fetch(SIGNAL_TRIGGERS_SQL, strategy_names, since_date)
+        
+        stats_by_strategy = {row['strategy_name']: row for row in stats_rows}
+        signals_by_strategy = defaultdict(list)
+        for row in rows:
+            signals_by_strategy[row['strategy_name']].append(row)
+        return stats_by_strategy, signals_by_strategy
+    
+    def _analyze_from_rows(self, strategy_name: str, stats: Optional[Dict[str, int]], results: List) -> Dict[str, Any]:
+        """Анализ результативности стратегии по уже загруженным данным"""
+        analysis = self._build_analysis(strategy_name, stats, results)
+        self._analysis_cache[strategy_name] = (time.monotonic(), analysis)
+        return analysis
+    
+    def _build_analysis(self, strategy_name: str, stats: Optional[Dict[str, int]], results: List) -> Dict[str, Any]:
+        rules = self.adaptation_rules[strategy_name]
+        target_accuracy = rules["target_accuracy"]
+        
+        total = stats['total'] if stats else 0
+        if total < rules["min_samples"]:
+            return {"status": "insufficient_data", "samples": total}
         
-        high_conf_accuracy = 0
-        low_conf_accuracy = 0
+        # Анализируем результаты
+        wins = stats['wins']
+        current_accuracy = wins / total if total > 0 else 0
         
-        if high_conf_results:
-            high_conf_wins = sum(1 for r in high_conf_results if r['result'] == 'win')
-            high_conf_accuracy = high_conf_wins / len(high_conf_results)
+        # Анализируем конфиденция vs результат
+        confidence_analysis = self._analyze_confidence_correlation(stats)
+        
+        # Анализируем триггерные метрики
+        metrics_analysis = self._analyze_trigger_metrics(results, strategy_name)
+        
+        return {
+            "status": "sufficient_data",
+            "total_signals": total,
+            "wins": wins,
+            "current_accuracy": current_accuracy,
+            "target_accuracy": target_accuracy,
+            "confidence_analysis": confidence_analysis,
+            "metrics_analysis": metrics_analysis,
+            "needs_adjustment": abs(current_accuracy - target_accuracy) > 0.05
+        }
+    
+    def _analyze_confidence_correlation(self, stats: Dict[str, int]) -> Dict[str, Any]:
+        """Анализ корреляции между confidence и результатом"""
+        if not stats or not stats['total']:
+            return {}
         
-        if low_conf_results:
-            low_conf_wins = sum(1 for r in low_conf_results if r['result'] == 'win')
-            low_conf_accuracy = low_conf_wins / len(low_conf_results)
+        high_conf_accuracy = stats['high_wins'] / stats['high_total'] if stats['high_total'] else 0
+        low_conf_accuracy = stats['low_wins'] / stats['low_total'] if stats['low_total'] else 0
         
         return {
             "high_confidence_accuracy": high_conf_accuracy,
@@ -166,93 +308,129 @@ class StrategyOptimizer:
         primary_metrics = self.adaptation_rules[strategy_name]["primary_metrics"]
         metrics_performance = {}
         
-        for metric in primary_metrics:
-            wins_with_metric = []
-            losses_with_metric = []
+        metric_values = {metric: [] for metric in primary_metrics}
+        metric_wins = {metric: [] for metric in primary_metrics}
+        
+        # Один проход по сигналам: trigger_metrics каждого разбираем один раз
+        for result in results:
+            metrics = result['trigger_metrics']
+            if not metrics:
+                continue
             
-            for result in results:
-                if result.get('trigger_metrics'):
-                    try:
-                        metrics = json.loads(result['trigger_metrics']) if isinstance(result['trigger_metrics'], str) else result['trigger_metrics']
-                        if metric in metrics:
-                            if result['result'] == 'win':
-                                wins_with_metric.append(metrics[metric])
-                            else:
-                                losses_with_metric.append(metrics[metric])
-                    except:
-                        continue
+            if isinstance(metrics, str):
+                try:
+                    metrics = orjson.loads(metrics) if orjson is not None else json.loads(metrics)
+                except ValueError:
+                    continue
+            
+            if not isinstance(metrics, dict):
+                continue
+            
+            is_win = result['result'] == 'win'
+            for metric in primary_metrics:
+                value = metrics.get(metric)
+                if value is not None:
+                    metric_values[metric].append(value)
+                    metric_wins[metric].append(is_win)
+        
+        for metric in primary_metrics:
+            values = np.asarray(metric_values[metric], dtype=np.float64)
+            wins = np.asarray(metric_wins[metric], dtype=np.bool_)
+            win_values = values[wins]
+            loss_values = values[~wins]
             
-            if wins_with_metric and losses_with_metric:
-                avg_win_value = sum(wins_with_metric) / len(wins_with_metric)
-                avg_loss_value = sum(losses_with_metric) / len(losses_with_metric)
+            if win_values.size and loss_values.size:
+                avg_win_value = float(win_values.mean())
+                avg_loss_value = float(loss_values.mean())
                 
                 metrics_performance[metric] = {
                     "avg_win_value": avg_win_value,
                     "avg_loss_value": avg_loss_value,
                     "difference": avg_win_value - avg_loss_value,
-                    "win_samples": len(wins_with_metric),
-                    "loss_samples": len(losses_with_metric)
+                    "win_samples": int(win_values.size),
+                    "loss_samples": int(loss_values.size)
                 }
         
         return metrics_performance
     
-    async def adapt_strategy_thresholds(self, strategy_name: str) -> bool:
+    async def adapt_strategy_thresholds(self, strategy_name: str, analysis: Optional[Dict[str, Any]] = None) -> bool:
         """Адаптация порогов стратегии на основе анализа"""
-        analysis = await self.analyze_strategy_performance(strategy_name)
+        if analysis is None:
+            analysis = await self.analyze_strategy_performance(strategy_name)
         
         if analysis.get("status") != "sufficient_data" or not analysis.get("needs_adjustment"):
             return False
         
-        conn = await self.get_db_connection()
-        if not conn:
-            return False
-        
         try:
-            # Получаем текущую конфигурацию
-            current_config = await conn.fetchval(
-                "SELECT config FROM strategy_configs WHERE strategy_name = $1",
-                strategy_name
-            )
-            
-            if not current_config:
-                return False
-            
-            config_dict = json.loads(current_config) if isinstance(current_config, str) else current_config
-            
-            # Применяем адаптацию
-            adjusted_config = self._adjust_config(config_dict, analysis, strategy_name)
-            
-            # Сохраняем обновленную конфигурацию
-            await conn.execute(
-                """UPDATE strategy_configs 
-                   SET config = $1, last_optimized = $2 
-                   WHERE strategy_name = $3""",
-                json.dumps(adjusted_config),
-                datetime.now(),
-                strategy_name
-            )
-            
-            self.logger.ml_update(
-                strategy_name,
-                {
-                    "old_accuracy": analysis["current_accuracy"],
-                    "target_accuracy": analysis["target_accuracy"],
-                    "adjustments_made": len(adjusted_config)
-                },
-                f"Адаптированы пороги для повышения точности"
-            )
-            
-            return True
-            
+            adapted = await self._adapt_configs({strategy_name: analysis})
         except Exception as e:
             self.logger.error(f"Ошибка адаптации стратегии {strategy_name}: {e}")
             return False
-        finally:
-            await conn.close()
+        
+        if strategy_name not in adapted:
+            return False
+        
+        self.logger.ml_update(
+            strategy_name,
+            {
+                "old_accuracy": analysis["current_accuracy"],
+                "target_accuracy": analysis["target_accuracy"],
+                "adjustments_made": adapted[strategy_name]
+            },
+            f"Адаптированы пороги для повышения точности"
+        )
+        return True
+    
+    async def _adapt_configs(self, analyses: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """Адаптация конфигураций нескольких стратегий за два обращения к БД
+        
+        Текущие конфигурации читаются одним запросом, обновленные
+        записываются одним executemany. Возвращает адаптированные
+        стратегии с количеством параметров в их конфигурации.
+        """
+        pool = await self._ensure_pool()
+        if not pool:
+            return {}
+        
+        adjusted_configs = {}
+        async with pool.acquire() as conn:
+            # Чтение и запись в одной транзакции: строки заблокированы
+            # от параллельного запуска оптимизатора до сохранения
+            async with conn.transaction():
+                # Получаем текущие конфигурации
+                rows = await conn.fetch(SELECT_CONFIGS_SQL, list(analyses))
+                
+                for row in rows:
+                    strategy_name = row['strategy_name']
+                    current_config = row['config']
+                    if not current_config:
+                        continue
+                    
+                    # Свежий словарь из этой выборки - корректируем его на месте
+                    if isinstance(current_config, str):
+                        config_dict = orjson.loads(current_config) if orjson is not None else json.loads(current_config)
+                    else:
+                        config_dict = current_config
+                    
+                    # Применяем адаптацию
+                    self._adjust_config_inplace(config_dict, analyses[strategy_name], strategy_name)
+                    adjusted_configs[strategy_name] = config_dict
+                
+                # Сохраняем обновленные конфигурации
+                if adjusted_configs:
+                    now = datetime.now()
+                    await conn.executemany(
+                        UPDATE_CONFIG_SQL,
+                        [
+                            (orjson.dumps(config).decode() if orjson is not None else json.dumps(config), now, name)
+                            for name, config in adjusted_configs.items()
+                        ]
+                    )
+        
+        return {name: len(config) for name, config in adjusted_configs.items()}
     
-    def _adjust_config(self, config: Dict[str, Any], analysis: Dict[str, Any], strategy_name: str) -> Dict[str, Any]:
-        """Корректировка конфигурации на основе анализа"""
-        adjusted_config = config.copy()
+    def _adjust_config_inplace(self, adjusted_config: Dict[str, Any], analysis: Dict[str, Any], strategy_name: str) -> None:
+        """Корректировка конфигурации на основе анализа (изменяет переданный словарь)"""
         adjustment_factor = self.adaptation_rules[strategy_name]["adjustment_factor"]
         current_accuracy = analysis["current_accuracy"]
         target_accuracy = analysis["target_accuracy"]
@@ -278,88 +456,84 @@ class StrategyOptimizer:
                     
                     if metric_data["difference"] > 0:
                         # Победные значения выше - увеличиваем порог
-                        adjusted_config[config_key] = old_value * multiplier
+                        new_value = old_value * multiplier
                     else:
                         # Победные значения ниже - уменьшаем порог
-                        adjusted_config[config_key] = old_value / multiplier
+                        new_value = old_value / multiplier
                     
                     # Ограничиваем экстремальные значения
-                    adjusted_config[config_key] = max(0.1, min(10.0, adjusted_config[config_key]))
-        
-        return adjusted_config
+                    if new_value < 0.1:
+                        new_value = 0.1
+                    elif new_value > 10.0:
+                        new_value = 10.0
+                    adjusted_config[config_key] = new_value
     
     def _map_metric_to_config_key(self, metric: str, strategy_name: str) -> str:
         """Маппинг метрики на ключ конфигурации"""
-        mapping = {
-            "over_2_5_goals": {
-                "dxg_combined": "min_dxg_combined",
-                "attacks_total": "min_attacks_total",
-                "shots_total": "min_shots_total"
-            },
-            "under_2_5_goals": {
-                "dxg_combined": "max_dxg_combined",
-                "stability_both": "min_stability_both",
-                "shots_per_attack": "max_shots_per_attack"
-            },
-            "btts_yes": {
-                "dxg_both_teams": "min_dxg_both_teams",
-                "shots_both": "min_shots_both",
-                "momentum_both": "min_momentum_both"
-            },
-            "btts_no": {
-                "dxg_weaker": "max_dxg_weaker",
-                "stability_stronger": "min_stability_stronger",
-                "away_shots": "max_away_shots"
-            },
-            "home_win": {
-                "dxg_advantage": "min_dxg_advantage",
-                "home_momentum": "min_home_momentum",
-                "shots_ratio": "min_home_shots_ratio"
-            },
-            "away_win": {
-                "dxg_advantage": "min_dxg_advantage",
-                "away_momentum": "min_away_momentum",
-                "dangerous_attacks": "min_away_dangerous_attacks"
-            },
-            "draw": {
-                "dxg_difference": "max_dxg_difference",
-                "stability_both": "min_stability_both",
-                "momentum_range": "balanced_momentum_range"
-            },
-            "next_goal_home": {
-                "home_momentum": "min_home_momentum",
-                "recent_attacks": "recent_attacks_home",
-                "away_stability": "low_away_stability"
-            },
-            "next_goal_away": {
-                "away_momentum": "min_away_momentum",
-                "recent_attacks": "recent_attacks_away",
-                "home_stability": "low_home_stability"
-            }
-        }
-        
-        return mapping.get(strategy_name, {}).get(metric, metric)
+        strategy_keys = _METRIC_CONFIG_KEYS.get(strategy_name)
+        return strategy_keys.get(metric, metric) if strategy_keys else metric
     
     async def optimize_all_strategies(self):
         """Оптимизация всех стратегий"""
         strategies = list(self.adaptation_rules.keys())
-        optimized_count = 0
         
+        # Сигналы всех стратегий за последние 30 дней - одним обращением к БД
+        try:
+            fetched = await self._fetch_all_signals(datetime.now() - timedelta(days=30))
+        except Exception as e:
+            self.logger.error(f"Ошибка загрузки сигналов: {e}")
+            fetched = None
+        
+        if fetched is None:
+            self.logger.header(f"Оптимизация завершена. Адаптировано стратегий: 0/{len(strategies)}")
+            return 0
+        
+        stats_by_strategy, signals_by_strategy = fetched
+        
+        # Анализируем стратегии и отбираем те, что нуждаются в адаптации
+        results: Dict[str, Any] = {}
+        pending = {}
         for strategy_name in strategies:
             try:
-                if await self.adapt_strategy_thresholds(strategy_name):
-                    optimized_count += 1
-                    self.logger.success(f"Стратегия {strategy_name} адаптирована")
-                else:
-                    self.logger.info(f"Стратегия {strategy_name} не требует адаптации")
-                    
-                # Небольшая задержка между оптимизациями
-                await asyncio.sleep(1)
-                
+                analysis = self._analyze_from_rows(
+                    strategy_name, stats_by_strategy.get(strategy_name), signals_by_strategy[strategy_name]
+                )
             except Exception as e:
-                self.logger.error(f"Ошибка оптимизации стратегии {strategy_name}: {e}")
+                results[strategy_name] = e
+                continue
+            
+            if analysis.get("status") == "sufficient_data" and analysis.get("needs_adjustment"):
+                pending[strategy_name] = analysis
+            else:
+                results[strategy_name] = False
         
-        self.logger.header(f"Оптимизация завершена. Адаптировано стратегий: {optimized_count}/{len(strategies)}")
+        # Все конфигурации адаптируем одним чтением и одной пакетной записью
+        if pending:
+            try:
+                adapted = await self._adapt_configs(pending)
+                for strategy_name in pending:
+                    results[strategy_name] = strategy_name in adapted
+            except Exception as e:
+                for strategy_name in pending:
+                    results[strategy_name] = e
+        
+        # Итог цикла - одной строкой лога вместо строки на каждую стратегию
+        adapted_names = []
+        errors_count = 0
+        for strategy_name in strategies:
+            result = results[strategy_name]
+            if isinstance(result, Exception):
+                errors_count += 1
+                self.logger.error(f"Ошибка оптимизации стратегии {strategy_name}: {result}")
+            elif result:
+                adapted_names.append(strategy_name)
+        
+        optimized_count = len(adapted_names)
+        self.logger.header(
+            f"Оптимизация завершена. Адаптировано стратегий: {optimized_count}/{len(strategies)}"
+            f" ({', '.join(adapted_names) or 'нет'}); без изменений: "
+            f"{len(strategies) - optimized_count - errors_count}; ошибок: {errors_count}"
+        )
         return optimized_count
 
 async def main():
@@ -377,6 +551,8 @@ async def main():
     print("\n=== Запуск оптимизации ===")
     optimized = await optimizer.optimize_all_strategies()
     print(f"Оптимизировано стратегий: {optimized}")
+    
+    await optimizer.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -4,15 +4,48 @@
 import asyncio
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
 from config import Config
 from api_client import APIClient
 from logger import BetBogLogger
+from rate_limiter import AsyncTokenBucket
+
+try:
+    import msgspec
+except ImportError:  # msgspec опционален: без него кэш хранится в JSON
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # orjson опционален: без него JSON кэш обрабатывает стандартный json
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba опционален: без него средние считает NumPy
+    njit = None
+
+# Сколько команд обновляется одновременно
+TEAM_UPDATE_CONCURRENCY = 16
 
-@dataclass
+# Лимит запросов истории матчей: не более 200 в минуту, допускаются всплески
+_HISTORY_RATE_LIMIT = 200
+_HISTORY_RATE_PERIOD = 60.0
+
+# Статистика команды (и файл кэша) считается устаревшей через 6 часов
+STATS_MAX_AGE_SECONDS = 6 * 60 * 60
+
+JSON_CACHE_FILE = "team_stats_cache.json"
+MSGPACK_CACHE_FILE = "team_stats_cache.msgpack"
+
+@dataclass(slots=True)
 class TeamStats:
     """Статистика команды"""
     team_name: str
@@ -30,6 +63,14 @@ class TeamStats:
     home_games: int = 0
     away_games: int = 0
     last_updated: str = ""
+    last_updated_ts: float = 0.0  # время обновления в секундах epoch, для проверок свежести
+    home_shot_efficiency: float = 0.0
+    away_shot_efficiency: float = 0.0
+    
+    def update_shot_efficiency(self):
+        """Пересчет реализации ударов (голы на удар) по средним показателям"""
+        self.home_shot_efficiency = self.home_avg_goals / max(self.home_avg_shots, 1)
+        self.away_shot_efficiency = self.away_avg_goals / max(self.away_avg_shots, 1)
     
     def to_dict(self) -> Dict[str, Any]:
         """Конвертация в словарь"""
@@ -40,15 +81,96 @@ class TeamStats:
         """Создание из словаря"""
         return cls(**data)
 
+if msgspec is not None:
+    # msgspec кодирует dataclass напрямую, отдельная схема не нужна
+    _CACHE_ENCODER = msgspec.msgpack.Encoder()
+    _CACHE_DECODER = msgspec.msgpack.Decoder(Dict[str, TeamStats])
+
+if njit is not None:
+    @njit(cache=True)
+    def _column_means(rows):
+        """Средние по столбцам за один проход по строкам
+        
+        Суммирование последовательное, как у sum(): результат совпадает
+        с прежним расчетом до бита. fastmath не включается.
+        """
+        n_rows, n_cols = rows.shape
+        sums = np.zeros(n_cols)
+        for i in range(n_rows):
+            for j in range(n_cols):
+                sums[j] += rows[i, j]
+        return sums / n_rows
+else:
+    def _column_means(rows):
+        """Средние по столбцам"""
+        return rows.mean(axis=0)
+
+# Ключи статистики матча для каждой стороны: голы и (атаки, удары, опасные атаки, угловые)
+_GOALS_KEYS = {'home': 'goals_home', 'away': 'goals_away'}
+_SIDE_STAT_KEYS = {
+    'home': ('attacks_home', 'shots_home', 'dangerous_home', 'corners_home'),
+    'away': ('attacks_away', 'shots_away', 'dangerous_away', 'corners_away'),
+}
+
+def _parse_score(ss: Any) -> Optional[Tuple[int, int]]:
+    """Разбор итогового счета вида '2-1'; None, если счет некорректен"""
+    if not isinstance(ss, str):
+        return None
+    idx = ss.find('-')
+    if idx <= 0:
+        return None
+    home_goals = ss[:idx].strip()
+    away_goals = ss[idx + 1:].strip()
+    # isdecimal принимает ровно те цифры, которые понимает int()
+    if not (home_goals.isdecimal() and away_goals.isdecimal()):
+        return None
+    return int(home_goals), int(away_goals)
+
+def _side_averages(goals: List[float], stat_rows: List[tuple]) -> List[float]:
+    """Средние голы и (атаки, удары, опасные атаки, угловые) по матчам одной стороны
+    
+    Строки статистики усредняются одним вызовом _column_means вместо
+    отдельных sum()/len() для каждого показателя.
+    """
+    averages = [float(_column_means(np.asarray(goals, dtype=np.float64).reshape(-1, 1))[0]) if goals else 0.0]
+    if stat_rows:
+        averages.extend(_column_means(np.asarray(stat_rows, dtype=np.float64)).tolist())
+    else:
+        averages.extend((0.0, 0.0, 0.0, 0.0))
+    return averages
+
+def _read_cache_file(path: str) -> bytes:
+    """Чтение файла кэша (выполняется в отдельном потоке)"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _write_cache_file(path: str, payload: bytes):
+    """Запись файла кэша через временный файл (выполняется в отдельном потоке)
+    
+    os.replace атомарно подменяет файл, так что прерванная запись
+    не оставляет поврежденный кэш. fsync перед подменой гарантирует,
+    что после сбоя под старым именем не окажется недописанный файл.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 class TeamStatsCache:
     """Система кэширования статистики команд"""
     
     def __init__(self, config: Config):
         self.config = config
         self.logger = BetBogLogger("TEAM_CACHE")
-        self.cache_file = "team_stats_cache.json"
+        self.cache_file = MSGPACK_CACHE_FILE if msgspec is not None else JSON_CACHE_FILE
         self.teams_stats: Dict[str, TeamStats] = {}
+        # Счетчики команд с домашними/гостевыми данными для get_cache_stats
+        self._teams_with_home = 0
+        self._teams_with_away = 0
         self.api_client: Optional[APIClient] = None
+        self._rate_limiter = AsyncTokenBucket(_HISTORY_RATE_LIMIT, _HISTORY_RATE_PERIOD)
         
     async def initialize(self, api_client: APIClient):
         """Инициализация системы кэширования"""
@@ -59,29 +181,57 @@ class TeamStatsCache:
         """Загрузка кэша из файла"""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    
-                for team_name, stats_data in cache_data.items():
-                    self.teams_stats[team_name] = TeamStats.from_dict(stats_data)
-                    
-                self.logger.success(f"Загружен кэш для {len(self.teams_stats)} команд")
+                cache_path = self.cache_file
+            elif os.path.exists(JSON_CACHE_FILE):
+                # Кэш в старом JSON формате - при сохранении перейдет в msgpack
+                cache_path = JSON_CACHE_FILE
             else:
                 self.logger.info("Файл кэша не найден, будет создан новый")
+                return
+            
+            # Файловые операции не блокируют цикл событий
+            raw = await asyncio.to_thread(_read_cache_file, cache_path)
+            
+            if cache_path == MSGPACK_CACHE_FILE:
+                self.teams_stats = _CACHE_DECODER.decode(raw)
+            else:
+                cache_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                for team_name, stats_data in cache_data.items():
+                    self.teams_stats[team_name] = TeamStats.from_dict(stats_data)
+            
+            # В кэше старого формата нет last_updated_ts и реализации ударов - восстанавливаем один раз при загрузке
+            for stats in self.teams_stats.values():
+                stats.update_shot_efficiency()
+                if not stats.last_updated_ts and stats.last_updated:
+                    try:
+                        stats.last_updated_ts = datetime.fromisoformat(stats.last_updated).timestamp()
+                    except ValueError:
+                        pass  # Некорректная дата - команда будет обновлена
+            
+            self._recount_teams_with_data()
+                
+            self.logger.success(f"Загружен кэш для {len(self.teams_stats)} команд")
                 
         except Exception as e:
             self.logger.error(f"Ошибка загрузки кэша: {str(e)}")
             self.teams_stats = {}
+            self._recount_teams_with_data()
     
     async def save_cache(self):
         """Сохранение кэша в файл"""
         try:
-            cache_data = {}
-            for team_name, stats in self.teams_stats.items():
-                cache_data[team_name] = stats.to_dict()
+            if msgspec is not None:
+                payload = _CACHE_ENCODER.encode(self.teams_stats)
+            elif orjson is not None:
+                # orjson сериализует dataclass напрямую, без asdict
+                payload = orjson.dumps(self.teams_stats)
+            else:
+                cache_data = {}
+                for team_name, stats in self.teams_stats.items():
+                    cache_data[team_name] = stats.to_dict()
+                payload = json.dumps(cache_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
                 
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            await asyncio.to_thread(_write_cache_file, self.cache_file, payload)
                 
             self.logger.success(f"Кэш сохранен для {len(self.teams_stats)} команд")
             
@@ -97,87 +247,100 @@ class TeamStatsCache:
         try:
             self.logger.header("Получение команд из live матчей для анализа последних матчей")
             
-            # Получаем все live матчи только для извлечения списка команд
+            # Одна сессия API на весь цикл обновления
             async with self.api_client:
+                # Получаем все live матчи только для извлечения списка команд
                 live_matches = await self.api_client.get_live_matches()
-            
-            if not live_matches:
-                self.logger.warning("Live матчи не найдены")
-                return
                 
-            unique_teams = set()
-            for match in live_matches:
-                if isinstance(match, dict):
-                    home_team = match.get('home', {}).get('name', '')
-                    away_team = match.get('away', {}).get('name', '')
-                    if home_team:
-                        unique_teams.add(home_team)
-                    if away_team:
-                        unique_teams.add(away_team)
+                if not live_matches:
+                    self.logger.warning("Live матчи не найдены")
+                    return
+                    
+                unique_teams = set()
+                for match in live_matches:
+                    if isinstance(match, dict):
+                        home_team = match.get('home', {}).get('name', '')
+                        away_team = match.get('away', {}).get('name', '')
+                        if home_team:
+                            unique_teams.add(home_team)
+                        if away_team:
+                            unique_teams.add(away_team)
+                
+                # Свежие команды отсеиваем до запросов и пула обновлений
+                stale_teams = [team_name for team_name in unique_teams if self._is_stale(team_name)]
+                self.logger.info(f"Найдено {len(unique_teams)} уникальных команд, требуют обновления: {len(stale_teams)}")
+                
+                if not stale_teams:
+                    return
+                
+                # Завершенные матчи загружаем один раз на весь цикл, а не для каждой команды
+                async with self._rate_limiter:
+                    finished_matches = await self.api_client.get_finished_matches(days_back=14)
             
-            self.logger.info(f"Найдено {len(unique_teams)} уникальных команд для анализа")
+            # Один проход по матчам вместо фильтрации всего списка для каждой команды
+            matches_by_team = self._index_matches_by_team(finished_matches)
+            
+            # Анализируем последние матчи команд параллельно, ограничивая число одновременных обновлений
+            semaphore = asyncio.Semaphore(TEAM_UPDATE_CONCURRENCY)
+            
+            async def update_one(team_name: str):
+                async with semaphore:
+                    await self.update_team_stats_from_recent_matches(
+                        team_name, finished_matches=matches_by_team.get(team_name, [])
+                    )
+            
+            results = await asyncio.gather(*(update_one(team_name) for team_name in stale_teams), return_exceptions=True)
             
-            # Анализируем последние матчи для каждой команды
             updated_count = 0
-            for team_name in unique_teams:
-                try:
-                    await self.update_team_stats_from_recent_matches(team_name)
+            for team_name, result in zip(stale_teams, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Ошибка обновления статистики для {team_name}: {str(result)}")
+                else:
                     updated_count += 1
                     
-                    # Пауза между запросами чтобы не перегружать API
-                    await asyncio.sleep(0.2)
-                    
-                except Exception as e:
-                    self.logger.error(f"Ошибка обновления статистики для {team_name}: {str(e)}")
-                    
             self.logger.success(f"Обновлена статистика для {updated_count} команд на основе последних матчей")
             await self.save_cache()
             
         except Exception as e:
             self.logger.error(f"Ошибка обновления команд: {str(e)}")
     
-    async def update_team_stats_from_recent_matches(self, team_name: str, max_matches: int = 10):
-        """Обновление статистики команды на основе последних 10 матчей"""
+    async def update_team_stats_from_recent_matches(self, team_name: str, max_matches: int = 10,
+                                                    finished_matches: Optional[List[Dict[str, Any]]] = None):
+        """Обновление статистики команды на основе последних 10 матчей
+        
+        finished_matches - уже загруженные завершенные матчи; если не переданы,
+        матчи запрашиваются у API.
+        """
         try:
             # Проверяем, нужно ли обновлять (если данные свежие)
-            if team_name in self.teams_stats:
-                last_updated = datetime.fromisoformat(self.teams_stats[team_name].last_updated)
-                if datetime.now() - last_updated < timedelta(hours=6):
-                    return  # Данные свежие, не обновляем
+            if not self._is_stale(team_name):
+                return  # Данные свежие, не обновляем
             
             self.logger.info(f"Поиск последних {max_matches} матчей для команды: {team_name}")
             
-            # Собираем матчи команды из разных периодов пока не найдем достаточно
             team_matches = []
-            days_back = 7  # Начинаем с недели
-            max_days_back = 180  # Максимум 6 месяцев назад
             
-            while len(team_matches) < max_matches and days_back <= max_days_back:
-                # Получаем завершенные матчи за период
-                async with self.api_client:
-                    finished_matches = await self.api_client.get_finished_matches(days_back=days_back)
-                
-                if not finished_matches:
-                    break
-                    
-                # Фильтруем матчи этой команды
-                for match in finished_matches:
-                    if isinstance(match, dict):
-                        home_team = match.get('home', {}).get('name', '')
-                        away_team = match.get('away', {}).get('name', '')
-                        if team_name == home_team or team_name == away_team:
-                            # Проверяем, что матч завершен
-                            if match.get('time_status') == '3':  # 3 = Finished
-                                # Избегаем дубликатов
-                                match_id = match.get('id', '')
-                                if not any(m.get('id') == match_id for m in team_matches):
-                                    team_matches.append(match)
-                                    
-                                    if len(team_matches) >= max_matches:
-                                        break
+            if finished_matches is not None:
+                self._collect_team_matches(team_name, finished_matches, team_matches, max_matches)
+            else:
+                # Собираем матчи команды из разных периодов пока не найдем достаточно
+                days_back = 7  # Начинаем с недели
+                max_days_back = 180  # Максимум 6 месяцев назад
                 
-                # Увеличиваем период поиска
-                days_back += 7
+                # Сессия открывается один раз на все запросы периодов
+                async with self.api_client:
+                    while len(team_matches) < max_matches and days_back <= max_days_back:
+                        # Получаем завершенные матчи за период
+                        async with self._rate_limiter:
+                            period_matches = await self.api_client.get_finished_matches(days_back=days_back)
+                        
+                        if not period_matches:
+                            break
+                        
+                        self._collect_team_matches(team_name, period_matches, team_matches, max_matches)
+                        
+                        # Увеличиваем период поиска
+                        days_back += 7
             
             if not team_matches:
                 self.logger.warning(f"Завершенные матчи команды {team_name} не найдены")
@@ -190,12 +353,64 @@ class TeamStatsCache:
             stats = await self.analyze_recent_team_matches(team_name, team_matches)
             
             # Сохраняем в кэш
-            self.teams_stats[team_name] = stats
+            self._store_team_stats(team_name, stats)
             self.logger.success(f"Статистика обновлена для {team_name}: {stats.total_games} последних матчей")
             
         except Exception as e:
             self.logger.error(f"Ошибка обновления статистики команды {team_name}: {str(e)}")
 
+    def _store_team_stats(self, team_name: str, stats: TeamStats):
+        """Сохранение статистики команды с обновлением счетчиков get_cache_stats"""
+        previous = self.teams_stats.get(team_name)
+        if previous is not None:
+            self._teams_with_home -= previous.home_games > 0
+            self._teams_with_away -= previous.away_games > 0
+        self._teams_with_home += stats.home_games > 0
+        self._teams_with_away += stats.away_games > 0
+        self.teams_stats[team_name] = stats
+
+    def _recount_teams_with_data(self):
+        """Полный пересчет счетчиков команд с данными (после загрузки кэша)"""
+        self._teams_with_home = sum(1 for stats in self.teams_stats.values() if stats.home_games > 0)
+        self._teams_with_away = sum(1 for stats in self.teams_stats.values() if stats.away_games > 0)
+
+    def _is_stale(self, team_name: str) -> bool:
+        """Нужно ли обновлять статистику команды (нет данных или старше 6 часов)"""
+        stats = self.teams_stats.get(team_name)
+        if stats is None:
+            return True
+        return time.time() - stats.last_updated_ts >= STATS_MAX_AGE_SECONDS
+
+    def _index_matches_by_team(self, matches: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Завершенные матчи, сгруппированные по командам-участникам"""
+        matches_by_team = defaultdict(list)
+        for match in matches:
+            if isinstance(match, dict) and match.get('time_status') == '3':  # 3 = Finished
+                home_team = match.get('home', {}).get('name', '')
+                away_team = match.get('away', {}).get('name', '')
+                matches_by_team[home_team].append(match)
+                if away_team != home_team:
+                    matches_by_team[away_team].append(match)
+        return matches_by_team
+
+    def _collect_team_matches(self, team_name: str, matches: List[Dict[str, Any]],
+                              team_matches: List[Dict[str, Any]], max_matches: int):
+        """Добавление завершенных матчей команды в team_matches (без дубликатов)"""
+        for match in matches:
+            if isinstance(match, dict):
+                home_team = match.get('home', {}).get('name', '')
+                away_team = match.get('away', {}).get('name', '')
+                if team_name == home_team or team_name == away_team:
+                    # Проверяем, что матч завершен
+                    if match.get('time_status') == '3':  # 3 = Finished
+                        # Избегаем дубликатов
+                        match_id = match.get('id', '')
+                        if not any(m.get('id') == match_id for m in team_matches):
+                            team_matches.append(match)
+                            
+                            if len(team_matches) >= max_matches:
+                                break
+
     async def update_team_stats_from_finished_matches(self, team_name: str, days_back: int = 14):
         """Обновление статистики команды на основе завершенных матчей (устаревший метод)"""
         # Перенаправляем на новый метод
@@ -208,228 +423,91 @@ class TeamStatsCache:
     
     async def analyze_finished_team_matches(self, team_name: str, matches: List[Dict[str, Any]]) -> TeamStats:
         """Анализ завершенных матчей команды для расчета средних показателей"""
-        stats = TeamStats(team_name=team_name, last_updated=datetime.now().isoformat())
-        
-        home_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
-        away_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
-        
-        for match in matches:
-            try:
-                # Определяем, играла ли команда дома или в гостях
-                home_team = match.get('home', {}).get('name', '')
-                away_team = match.get('away', {}).get('name', '')
-                
-                # Проверяем, что матч завершен и есть итоговый счет
-                if match.get('time_status') != '3':  # 3 = Finished
-                    continue
-                
-                # Получаем финальный счет
-                ss = match.get('ss', '')
-                if not ss:
-                    continue
-                    
-                try:
-                    home_goals, away_goals = map(int, ss.split('-'))
-                except:
-                    continue
-                
-                # Получаем статистику матча (если доступна)
-                match_stats = match.get('stats', {})
-                
-                if team_name == home_team:
-                    # Команда играла дома
-                    stats.home_games += 1
-                    home_stats['goals'].append(home_goals)
-                    
-                    # Добавляем статистику, если доступна
-                    if match_stats:
-                        home_stats['attacks'].append(match_stats.get('attacks_home', 0))
-                        home_stats['shots'].append(match_stats.get('shots_home', 0))
-                        home_stats['dangerous'].append(match_stats.get('dangerous_home', 0))
-                        home_stats['corners'].append(match_stats.get('corners_home', 0))
-                    
-                elif team_name == away_team:
-                    # Команда играла в гостях
-                    stats.away_games += 1
-                    away_stats['goals'].append(away_goals)
-                    
-                    # Добавляем статистику, если доступна
-                    if match_stats:
-                        away_stats['attacks'].append(match_stats.get('attacks_away', 0))
-                        away_stats['shots'].append(match_stats.get('shots_away', 0))
-                        away_stats['dangerous'].append(match_stats.get('dangerous_away', 0))
-                        away_stats['corners'].append(match_stats.get('corners_away', 0))
-                    
-            except Exception as e:
-                self.logger.debug(f"Ошибка анализа матча: {str(e)}")
-                continue
-        
-        # Рассчитываем средние значения
-        if stats.home_games > 0:
-            stats.home_avg_goals = sum(home_stats['goals']) / stats.home_games
-            if home_stats['attacks']:
-                stats.home_avg_attacks = sum(home_stats['attacks']) / len(home_stats['attacks'])
-            if home_stats['shots']:
-                stats.home_avg_shots = sum(home_stats['shots']) / len(home_stats['shots'])
-            if home_stats['dangerous']:
-                stats.home_avg_dangerous = sum(home_stats['dangerous']) / len(home_stats['dangerous'])
-            if home_stats['corners']:
-                stats.home_avg_corners = sum(home_stats['corners']) / len(home_stats['corners'])
-            
-        if stats.away_games > 0:
-            stats.away_avg_goals = sum(away_stats['goals']) / stats.away_games
-            if away_stats['attacks']:
-                stats.away_avg_attacks = sum(away_stats['attacks']) / len(away_stats['attacks'])
-            if away_stats['shots']:
-                stats.away_avg_shots = sum(away_stats['shots']) / len(away_stats['shots'])
-            if away_stats['dangerous']:
-                stats.away_avg_dangerous = sum(away_stats['dangerous']) / len(away_stats['dangerous'])
-            if away_stats['corners']:
-                stats.away_avg_corners = sum(away_stats['corners']) / len(away_stats['corners'])
-        
-        stats.total_games = stats.home_games + stats.away_games
-        
-        return stats
+        return self._analyze_matches(team_name, matches, finished_only=True)
 
     async def analyze_recent_team_matches(self, team_name: str, matches: List[Dict[str, Any]]) -> TeamStats:
         """Анализ последних матчей команды для расчета средних показателей"""
-        stats = TeamStats(team_name=team_name, last_updated=datetime.now().isoformat())
+        return self._analyze_matches(team_name, matches)
+
+    async def analyze_team_matches(self, team_name: str, matches: List[Dict[str, Any]]) -> TeamStats:
+        """Анализ матчей команды для расчета средних показателей"""
+        return self._analyze_matches(team_name, matches, goals_from_stats=True)
+
+    def _analyze_matches(self, team_name: str, matches: List[Dict[str, Any]],
+                         finished_only: bool = False, goals_from_stats: bool = False) -> TeamStats:
+        """Расчет средних показателей команды по списку матчей
         
-        home_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
-        away_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
+        finished_only - учитывать только завершенные матчи;
+        goals_from_stats - брать голы из статистики матча вместо итогового
+        счета (матчи без статистики тогда пропускаются).
+        """
+        now = time.time()
+        stats = TeamStats(team_name=team_name, last_updated=datetime.fromtimestamp(now).isoformat(),
+                          last_updated_ts=now)
+        
+        goal_values = {'home': [], 'away': []}
+        stat_rows = {'home': [], 'away': []}
         
         for match in matches:
             try:
                 # Определяем, играла ли команда дома или в гостях
-                home_team = match.get('home', {}).get('name', '')
-                away_team = match.get('away', {}).get('name', '')
-                
-                # Получаем финальный счет
-                ss = match.get('ss', '')
-                if not ss:
+                if team_name == match.get('home', {}).get('name', ''):
+                    side = 'home'
+                elif team_name == match.get('away', {}).get('name', ''):
+                    side = 'away'
+                else:
                     continue
-                    
-                try:
-                    home_goals, away_goals = map(int, ss.split('-'))
-                except:
+                
+                # Проверяем, что матч завершен
+                if finished_only and match.get('time_status') != '3':  # 3 = Finished
                     continue
                 
                 # Получаем статистику матча (если доступна)
                 match_stats = match.get('stats', {})
                 
-                if team_name == home_team:
-                    # Команда играла дома
-                    stats.home_games += 1
-                    home_stats['goals'].append(home_goals)
-                    
-                    # Добавляем статистику, если доступна
-                    if match_stats:
-                        home_stats['attacks'].append(match_stats.get('attacks_home', 0))
-                        home_stats['shots'].append(match_stats.get('shots_home', 0))
-                        home_stats['dangerous'].append(match_stats.get('dangerous_home', 0))
-                        home_stats['corners'].append(match_stats.get('corners_home', 0))
-                    
-                elif team_name == away_team:
-                    # Команда играла в гостях
-                    stats.away_games += 1
-                    away_stats['goals'].append(away_goals)
-                    
-                    # Добавляем статистику, если доступна
-                    if match_stats:
-                        away_stats['attacks'].append(match_stats.get('attacks_away', 0))
-                        away_stats['shots'].append(match_stats.get('shots_away', 0))
-                        away_stats['dangerous'].append(match_stats.get('dangerous_away', 0))
-                        away_stats['corners'].append(match_stats.get('corners_away', 0))
+                if goals_from_stats:
+                    if not match_stats:
+                        continue
+                    goals = match_stats.get(_GOALS_KEYS[side], 0)
+                else:
+                    # Получаем финальный счет
+                    score = _parse_score(match.get('ss', ''))
+                    if score is None:
+                        continue
+                    goals = score[0] if side == 'home' else score[1]
+                
+                self._accumulate(goal_values[side], stat_rows[side], side, match_stats, goals)
                     
             except Exception as e:
                 self.logger.debug(f"Ошибка анализа матча: {str(e)}")
                 continue
         
+        stats.home_games = len(goal_values['home'])
+        stats.away_games = len(goal_values['away'])
+        
         # Рассчитываем средние значения
         if stats.home_games > 0:
-            stats.home_avg_goals = sum(home_stats['goals']) / stats.home_games
-            if home_stats['attacks']:
-                stats.home_avg_attacks = sum(home_stats['attacks']) / len(home_stats['attacks'])
-            if home_stats['shots']:
-                stats.home_avg_shots = sum(home_stats['shots']) / len(home_stats['shots'])
-            if home_stats['dangerous']:
-                stats.home_avg_dangerous = sum(home_stats['dangerous']) / len(home_stats['dangerous'])
-            if home_stats['corners']:
-                stats.home_avg_corners = sum(home_stats['corners']) / len(home_stats['corners'])
+            (stats.home_avg_goals, stats.home_avg_attacks, stats.home_avg_shots,
+             stats.home_avg_dangerous, stats.home_avg_corners) = _side_averages(goal_values['home'], stat_rows['home'])
             
         if stats.away_games > 0:
-            stats.away_avg_goals = sum(away_stats['goals']) / stats.away_games
-            if away_stats['attacks']:
-                stats.away_avg_attacks = sum(away_stats['attacks']) / len(away_stats['attacks'])
-            if away_stats['shots']:
-                stats.away_avg_shots = sum(away_stats['shots']) / len(away_stats['shots'])
-            if away_stats['dangerous']:
-                stats.away_avg_dangerous = sum(away_stats['dangerous']) / len(away_stats['dangerous'])
-            if away_stats['corners']:
-                stats.away_avg_corners = sum(away_stats['corners']) / len(away_stats['corners'])
+            (stats.away_avg_goals, stats.away_avg_attacks, stats.away_avg_shots,
+             stats.away_avg_dangerous, stats.away_avg_corners) = _side_averages(goal_values['away'], stat_rows['away'])
         
         stats.total_games = stats.home_games + stats.away_games
+        stats.update_shot_efficiency()
         
         return stats
 
-    async def analyze_team_matches(self, team_name: str, matches: List[Dict[str, Any]]) -> TeamStats:
-        """Анализ матчей команды для расчета средних показателей"""
-        stats = TeamStats(team_name=team_name, last_updated=datetime.now().isoformat())
-        
-        home_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
-        away_stats = {'goals': [], 'attacks': [], 'shots': [], 'dangerous': [], 'corners': []}
-        
-        for match in matches:
-            try:
-                # Определяем, играла ли команда дома или в гостях
-                home_team = match.get('home', {}).get('name', '')
-                away_team = match.get('away', {}).get('name', '')
-                
-                # Получаем статистику матча
-                match_stats = match.get('stats', {})
-                if not match_stats:
-                    continue
-                
-                if team_name == home_team:
-                    # Команда играла дома
-                    stats.home_games += 1
-                    home_stats['goals'].append(match_stats.get('goals_home', 0))
-                    home_stats['attacks'].append(match_stats.get('attacks_home', 0))
-                    home_stats['shots'].append(match_stats.get('shots_home', 0))
-                    home_stats['dangerous'].append(match_stats.get('dangerous_home', 0))
-                    home_stats['corners'].append(match_stats.get('corners_home', 0))
-                    
-                elif team_name == away_team:
-                    # Команда играла в гостях
-                    stats.away_games += 1
-                    away_stats['goals'].append(match_stats.get('goals_away', 0))
-                    away_stats['attacks'].append(match_stats.get('attacks_away', 0))
-                    away_stats['shots'].append(match_stats.get('shots_away', 0))
-                    away_stats['dangerous'].append(match_stats.get('dangerous_away', 0))
-                    away_stats['corners'].append(match_stats.get('corners_away', 0))
-                    
-            except Exception as e:
-                self.logger.debug(f"Ошибка анализа матча: {str(e)}")
-                continue
-        
-        # Рассчитываем средние значения
-        if stats.home_games > 0:
-            stats.home_avg_goals = sum(home_stats['goals']) / stats.home_games
-            stats.home_avg_attacks = sum(home_stats['attacks']) / stats.home_games
-            stats.home_avg_shots = sum(home_stats['shots']) / stats.home_games
-            stats.home_avg_dangerous = sum(home_stats['dangerous']) / stats.home_games
-            stats.home_avg_corners = sum(home_stats['corners']) / stats.home_games
-            
-        if stats.away_games > 0:
-            stats.away_avg_goals = sum(away_stats['goals']) / stats.away_games
-            stats.away_avg_attacks = sum(away_stats['attacks']) / stats.away_games
-            stats.away_avg_shots = sum(away_stats['shots']) / stats.away_games
-            stats.away_avg_dangerous = sum(away_stats['dangerous']) / stats.away_games
-            stats.away_avg_corners = sum(away_stats['corners']) / stats.away_games
-        
-        stats.total_games = stats.home_games + stats.away_games
+    @staticmethod
+    def _accumulate(goal_values: List[float], stat_rows: List[tuple], side: str,
+                    match_stats: Dict[str, Any], goals: float):
+        """Добавление голов и статистики одного матча для стороны side"""
+        goal_values.append(goals)
         
-        return stats
+        # Добавляем статистику, если доступна
+        if match_stats:
+            stat_rows.append(tuple(match_stats.get(key, 0) for key in _SIDE_STAT_KEYS[side]))
     
     def get_team_stats(self, team_name: str) -> Optional[TeamStats]:
         """Получение статистики команды из кэша"""
@@ -454,8 +532,8 @@ class TeamStatsCache:
                 'predicted_total_goals': home_stats.home_avg_goals + away_stats.away_avg_goals,
                 'home_attack_strength': home_stats.home_avg_attacks,
                 'away_attack_strength': away_stats.away_avg_attacks,
-                'home_shot_efficiency': home_stats.home_avg_goals / max(home_stats.home_avg_shots, 1),
-                'away_shot_efficiency': away_stats.away_avg_goals / max(away_stats.away_avg_shots, 1),
+                'home_shot_efficiency': home_stats.home_shot_efficiency,
+                'away_shot_efficiency': away_stats.away_shot_efficiency,
                 'home_games_analyzed': home_stats.home_games,
                 'away_games_analyzed': away_stats.away_games
             })
@@ -464,25 +542,24 @@ class TeamStatsCache:
     
     async def is_cache_outdated(self) -> bool:
         """Проверка актуальности кэша"""
-        if not os.path.exists(self.cache_file):
-            return True
-            
+        # Один stat вместо exists + getmtime
         try:
-            file_modified = datetime.fromtimestamp(os.path.getmtime(self.cache_file))
-            return datetime.now() - file_modified > timedelta(hours=6)
-        except:
+            cache_stat = os.stat(self.cache_file)
+        except OSError:
             return True
+        return time.time() - cache_stat.st_mtime > STATS_MAX_AGE_SECONDS
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Получение статистики кэша"""
-        total_teams = len(self.teams_stats)
-        teams_with_home_data = sum(1 for stats in self.teams_stats.values() if stats.home_games > 0)
-        teams_with_away_data = sum(1 for stats in self.teams_stats.values() if stats.away_games > 0)
+        try:
+            cache_stat = os.stat(self.cache_file)
+        except OSError:
+            cache_stat = None
         
         return {
-            'total_teams': total_teams,
-            'teams_with_home_data': teams_with_home_data,
-            'teams_with_away_data': teams_with_away_data,
-            'cache_file_exists': os.path.exists(self.cache_file),
-            'last_modified': datetime.fromtimestamp(os.path.getmtime(self.cache_file)).isoformat() if os.path.exists(self.cache_file) else None
+            'total_teams': len(self.teams_stats),
+            'teams_with_home_data': self._teams_with_home,
+            'teams_with_away_data': self._teams_with_away,
+            'cache_file_exists': cache_stat is not None,
+            'last_modified': datetime.fromtimestamp(cache_stat.st_mtime).isoformat() if cache_stat is not None else None
         }
\ No newline at end of file